@@ -8,6 +8,7 @@ DEFAULT_POSTGRES_PASSWORD = "password1"
 DEFAULT_POSTGRES_HOST = "postgres"
 DEFAULT_POSTGRES_PORT = "5432"
 DEFAULT_POSTGRES_DB = "youtube_summarizer"
+VIDEO_RECORDS_COPY_THRESHOLD = 200  # New video records at or above which COPY is used instead of INSERTs
 
 # Default MongoDB connection parameters
 DEFAULT_MONGO_HOST = "mongo"
@@ -21,6 +22,8 @@ DEFAULT_RABBITMQ_PORT = "5672"
 DEFAULT_KAFKA_BOOTSTRAP_SERVERS = "kafka:29092"
 DEFAULT_KAFKA_HOST = "kafka"
 DEFAULT_KAFKA_PORT = "29092"
+KAFKA_BATCH_SIZE = 64 * 1024  # bytes of events sent to a partition in one request
+KAFKA_COMPRESSION_TYPE = "gzip"  # Supported by kafka-python without extra packages
 
 # Default API server settings
 DEFAULT_API_HOST = "0.0.0.0"
@@ -11,8 +11,41 @@ CHUNK_TARGET_SIZE = 3000
 
 
 
+# Concurrency constants
+DISCOVERY_MAX_CONCURRENT_FETCHES = 8
+DISCOVERY_LISTING_HEADROOM = 3  # Channel entries listed per requested video, leaving room for already known videos
+MAX_AUDIO_STT_POOL_SIZE = 32
+AUDIO_STT_THREADS_PER_CPU = 5  # Speech recognition is network-bound, so oversubscribe the CPUs
+YOUTUBE_PLAYER_API_LIMIT_PER_HOST = 64
+DOWNLOAD_MAX_CONCURRENT = 2  # Kept low so YouTube does not throttle or block the downloads
+DEFAULT_DOWNLOAD_CONCURRENT_FRAGMENTS = 4  # Fragments of one DASH/HLS download fetched in parallel
+FILE_IO_MAX_WORKERS = 4  # Threads for small transcription and summary file reads and writes
+EVENT_ACK_BATCH_SIZE = 64  # Events the logging service acknowledges with a single ack
+WORKER_MAX_CONCURRENT_MESSAGES = 8  # Messages a service worker processes at once, and prefetches to wait for a slot
+
+# Download constants
+DOWNLOAD_HTTP_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB
+DOWNLOAD_RETRIES = 3
+YOUTUBE_RATE_LIMIT_ERROR = "HTTP Error 429"  # How yt-dlp reports YouTube rate limiting
+DEFAULT_YT_DLP_CACHE_DIR_NAME = "yt-dlp-shared"  # Under ~/.cache when YT_DLP_CACHE_DIR is not set
+
+# YouTube player API constants
+YOUTUBE_PLAYER_API_URL = "https://www.youtube.com/youtubei/v1/player"
+YOUTUBE_PLAYER_API_CLIENT_NAME = "WEB"
+YOUTUBE_PLAYER_API_CLIENT_VERSION = "2.20240101.00.00"
+VIDEO_DETAILS_CACHE_SIZE = 10000
+
+# Audio constants
+AUDIO_SAMPLE_RATE_HZ = 16000
+TRANSCRIPTION_LANGUAGE_CODE = "en-US"
+RECOGNIZER_ENERGY_THRESHOLD = 300
+
 # File handling constants
 MAX_FILENAME_LENGTH = 100
+SANITIZED_FILENAME_CACHE_SIZE = 4096  # Titles seen across retries and services of one channel
+MIN_VALID_AUDIO_BYTES = 1024  # Smaller audio files are left over from failed downloads
+MIN_VALID_CAPTION_BYTES = 100  # Smaller caption files hold no cues beyond the WEBVTT header
+MIN_VALID_TRANSCRIPTION_BYTES = 16  # Smaller transcription files are left over from crashed writes
 LOG_MAX_FILE_SIZE = 1024 * 1024  # 1 MB
 LOG_BACKUP_COUNT = 5
 
@@ -22,6 +55,13 @@ EVENTS_EXCHANGE_NAME = 'events_exchange'
 # Environment variable names
 POSTGRES_URL_ENV = 'POSTGRES_URL'
 OPENAI_API_KEY_ENV = 'OPENAI_API_KEY'
+AUDIO_STT_POOL_SIZE_ENV = 'AUDIO_STT_POOL_SIZE'
+GOOGLE_CLOUD_SPEECH_ENV = 'USE_GOOGLE_CLOUD_SPEECH'
+DOWNLOAD_CONCURRENT_FRAGMENTS_ENV = 'DOWNLOAD_CONCURRENT_FRAGMENTS'
+YT_DLP_CACHE_DIR_ENV = 'YT_DLP_CACHE_DIR'
+YTDLP_CONCURRENCY_ENV = 'YTDLP_CONCURRENCY'
+DISCOVERY_CONCURRENCY_ENV = 'DISCOVERY_CONCURRENCY'
+WORKER_CONCURRENCY_ENV = 'WORKER_CONCURRENCY'
 
 # Service host and port constants
 RABBITMQ_HOST = 'rabbitmq'
@@ -34,7 +74,8 @@ DEFAULT_MONGO_URL = 'mongodb://mongo:27017/'
 DEFAULT_MAX_VIDEO_LENGTH = 10
 
 # Encoding constants
-TOKENCODER_ENCODING_NAME = "cl100k_base"
+TOKENCODER_ENCODING_NAME = "o200k_base"
+TOKENIZER_NUM_THREADS = 8
 
 # Application name
 APP_NAME = "youtube_summarizer"
@@ -47,4 +88,7 @@ TRANSCRIPTION_FILE_EXTENSION = ".txt"
 CAPTION_FILE_EXTENSION = ".en.vtt"
 
 # AI Model constants
-DEFAULT_OPENAI_MODEL = "gpt-3.5-turbo"
\ No newline at end of file
+DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
+CHUNK_SUMMARY_MAX_TOKENS = 300
+FINAL_SUMMARY_MAX_TOKENS = 800
+SUMMARY_TEMPERATURE = 0.2
\ No newline at end of file
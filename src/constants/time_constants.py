@@ -13,6 +13,7 @@ POSTGRES_CONNECT_TIMEOUT = 10  # seconds
 RABBITMQ_BLOCKED_CONNECTION_TIMEOUT = 300  # seconds
 RABBITMQ_SOCKET_TIMEOUT = 10  # seconds
 RABBITMQ_HEARTBEAT_INTERVAL = 600  # seconds
+EVENT_ACK_FLUSH_INTERVAL = 0.2  # seconds a partial batch of events waits for its ack
 
 # Kafka timeouts
 KAFKA_REQUEST_TIMEOUT_MS = 15000  # 15 seconds
@@ -20,9 +21,12 @@ KAFKA_MAX_BLOCK_MS = 5000
 KAFKA_RECONNECT_BACKOFF_MAX_MS = 1000
 KAFKA_RECONNECT_BACKOFF_MS = 50  # Initial backoff in ms
 KAFKA_SEND_TIMEOUT = 15  # seconds
+KAFKA_API_VERSION_AUTO_TIMEOUT_MS = 2000  # Fail fast on the broker version handshake when Kafka is down
+KAFKA_LINGER_MS = 20  # How long events wait to be batched with the next ones
 
 # Time delays and intervals
 KAFKA_CONSUMER_RETRY_DELAY = 5  # seconds
+KAFKA_CONSUMER_MAX_RETRY_DELAY = 60  # seconds
 RABBITMQ_RETRY_DELAY = 5  # seconds
 MONGODB_RETRY_DELAY = 5  # seconds
 GENERAL_RETRY_DELAY = 5  # seconds
@@ -30,6 +34,12 @@ BACKOFF_MULTIPLIER = 2  # For exponential backoff
 
 # Audio processing
 AUDIO_CHUNK_LENGTH_MS = 10000  # 10 seconds
+GOOGLE_CLOUD_STREAM_MAX_AUDIO_MS = 290000  # Google Cloud streaming calls are limited to about 5 minutes of audio
+GOOGLE_CLOUD_STREAM_FRAME_MS = 100  # Audio sent per streaming request; Google recommends 100 ms frames
 
 # API and network timeouts
-DEFAULT_REQUEST_TIMEOUT = 30  # seconds
\ No newline at end of file
+DEFAULT_REQUEST_TIMEOUT = 30  # seconds
+YOUTUBE_PLAYER_API_DEFAULT_RETRY_AFTER = 30  # seconds, when a rate-limited response has no Retry-After header
+YOUTUBE_RATE_LIMIT_PAUSE = 60  # seconds new downloads wait after YouTube rate limits one
+VIDEO_DETAILS_CACHE_TTL = 24 * 3600  # seconds, video metadata rarely changes within a day
+VIDEO_DETAILS_FAILURE_CACHE_TTL = 300  # seconds before a video whose details could not be fetched is tried again
\ No newline at end of file
@@ -6,6 +6,7 @@ The new architecture uses microservices with RabbitMQ queues.
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from src.pipeline.VideoDiscoverer import VideoDiscoverer
 from src.pipeline.VideoDownloader import VideoDownloader
 from src.pipeline.AudioTranscriber import AudioTranscriber
@@ -16,8 +17,7 @@ from src.pipeline.VideoProcessor import VideoProcessor
 from src.utils.file_manager import FileManager
 from src.utils.config import Config
 from src.pipeline.VideoMetadataFetcher import VideoMetadataFetcher
-
-import aiofiles
+from src.constants.service_constants import FILE_IO_MAX_WORKERS, DOWNLOAD_MAX_CONCURRENT
 
 def initialize_services(logger: logging.Logger, file_manager: FileManager, is_openai_runtime: bool) -> dict:
     """Initializes and returns all necessary service clients."""
@@ -27,6 +27,10 @@ def initialize_services(logger: logging.Logger, file_manager: FileManager, is_op
         'audio_extractor': AudioExtractor(logger),
         'audio_transcriber': AudioTranscriber(logger),  # Now handles async internally
         'summarizer': OpenAISummarizerAgent(is_openai_runtime, logger),
+        # Dedicated to small file reads and writes, so they do not queue behind downloads or transcription
+        'fs_executor': ThreadPoolExecutor(max_workers=FILE_IO_MAX_WORKERS, thread_name_prefix="fs"),
+        # Shared by all videos, so the next videos download while earlier ones extract and transcribe
+        'download_semaphore': asyncio.Semaphore(DOWNLOAD_MAX_CONCURRENT),
     }
 
 async def process_video_wrapper(video_data: dict, services: dict, config: Config, logger: logging.Logger, executor: ThreadPoolExecutor):
@@ -34,27 +38,34 @@ async def process_video_wrapper(video_data: dict, services: dict, config: Config
     Asynchronous wrapper function to process a single video, summarize it, and clean up.
     """
     video_processor = VideoProcessor(video_data, services, logger, executor)
-    transcription_text = await video_processor.process()
+    try:
+        transcription_text = await video_processor.process()
 
-    if not transcription_text:
-        return
+        if not transcription_text:
+            return
 
-    video_id = video_data['video_id']
-    logger.info(f"[{video_id}] Step 3.5: Summarizing transcription...")
-    summarizer: OpenAISummarizerAgent = services['summarizer']
-    summary_text = await summarizer.summary_call(transcription_text)
+        video_id = video_data['video_id']
+        logger.info(f"[{video_id}] Step 3.5: Summarizing transcription...")
+        summarizer: OpenAISummarizerAgent = services['summarizer']
+        summary_text = await summarizer.summary_call(transcription_text)
 
-    if not summary_text:
-        logger.error(f"[{video_id}] Summarization failed.")
-        return
+        if not summary_text:
+            logger.error(f"[{video_id}] Summarization failed.")
+            return
 
-    file_manager: FileManager = services['file_manager']
-    video_paths = file_manager.get_video_paths(video_data)
-    summary_path = video_paths["summary"]
-    
-    async with aiofiles.open(summary_path, "w", encoding="utf-8") as f:
-        await f.write(summary_text)
-    logger.info(f"[{video_id}] Summarization complete. Summary saved to: {summary_path}")
+        # The processor already built this video's paths, so reuse them rather than building them again
+        file_manager: FileManager = services['file_manager']
+        video_paths = video_processor.video_paths
+        summary_path = video_paths["summary"]
+
+        await asyncio.get_running_loop().run_in_executor(
+            services['fs_executor'], partial(summary_path.write_text, summary_text, encoding="utf-8")
+        )
+        logger.info(f"[{video_id}] Summarization complete. Summary saved to: {summary_path}")
+    finally:
+        # The transcription is written in the background while summarizing, so make sure it is on
+        # disk before moving on, and before the intermediate files are cleaned up
+        await video_processor.wait_for_pending_writes()
 
     if config.is_save_only_summaries:
         logger.info(f"[{video_id}] Step 4.1: Cleaning up intermediate files...")
@@ -102,8 +113,11 @@ async def main():
 
     logger.info("\n--- All processing complete. ---")
     
-    # Clean up the executor
+    # Clean up the executors and the OpenAI client
     executor.shutdown(wait=True)
+    services['fs_executor'].shutdown(wait=True)
+    AudioTranscriber.shutdown_executor()
+    await services['summarizer'].aclose()
 
 if __name__ == '__main__':
     asyncio.run(main())
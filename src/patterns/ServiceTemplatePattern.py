@@ -44,7 +44,6 @@ class ServiceTemplate(Generic[T], BaseService, abc.ABC):
         self.logger.info("[%s] Starting %s task", identifier, self.service_type.name)
 
         try:
-            await self._update_status_if_needed(data)
             video = self._get_video_record(data)
             if video is False:  # Error occurred
                 return False
@@ -65,17 +64,13 @@ class ServiceTemplate(Generic[T], BaseService, abc.ABC):
         """Extract the identifier from message data."""
         return data.get("video_id", data.get("job_id", "unknown"))
 
-    async def _update_status_if_needed(self, data: Dict[str, Any]) -> bool:
-        """Update video status to IN_PROGRESS if video_id is present in data."""
-        if "video_id" in data:
-            if not self.db_manager.update_video_stage_and_status(data["video_id"], self.service_type.name, ProcessingStatus.PROCESSING.value):
-                return False
-        return True
-
     def _get_video_record(self, data: Dict[str, Any]):
-        """Get the video record if video_id is present in data."""
+        """
+        Get the video record if video_id is present in data, marking it as being processed
+        by this service in the same transaction.
+        """
         if "video_id" in data:
-            video = self.db_manager.get_video(data["video_id"])
+            video = self.db_manager.start_video_stage(data["video_id"], self.service_type.name, ProcessingStatus.PROCESSING.value)
             if not video:
                 return False
             return video
@@ -173,7 +168,7 @@ class ServiceTemplate(Generic[T], BaseService, abc.ABC):
 
         service_specific_fields = self.get_service_specific_event_fields(video_id, video, result)
 
-        self.event_manager.publish_event(
+        self.event_manager.publish_event_in_background(
             self.service_type.name,
             self.event_manager.build_event_payload(video_id, video, result, service_specific_fields),
             video_id
@@ -2,13 +2,25 @@
 Module for summarizing text using OpenAI's API.
 """
 import os
+import re
 from typing import Optional, List
 from openai import AsyncOpenAI
 import tiktoken
 import logging
 import asyncio
 from src.utils.common_logger import log_success_by_video_id, log_error_by_video_id
-from src.constants.service_constants import CHUNK_TARGET_SIZE, TOKENCODER_ENCODING_NAME, DEFAULT_OPENAI_MODEL
+from src.constants.service_constants import (
+    CHUNK_TARGET_SIZE,
+    TOKENCODER_ENCODING_NAME,
+    TOKENIZER_NUM_THREADS,
+    DEFAULT_OPENAI_MODEL,
+    CHUNK_SUMMARY_MAX_TOKENS,
+    FINAL_SUMMARY_MAX_TOKENS,
+    SUMMARY_TEMPERATURE
+)
+
+# Splits after sentence-ending punctuation or on line breaks, keeping the punctuation with its sentence
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+|\n+')
 
 
 class OpenAISummarizerAgent:
@@ -16,17 +28,30 @@ class OpenAISummarizerAgent:
     An asynchronous class to handle text summarization using the OpenAI API.
     It supports chunking and recursive summarization for long texts.
     """
-    def __init__(self, is_openai_runtime: bool = False, logger: Optional[logging.Logger] = None):
+    def __init__(self, is_openai_runtime: bool = False, logger: Optional[logging.Logger] = None, model: str = DEFAULT_OPENAI_MODEL):
         """
         Initializes the OpenAISummarizerAgent.
         """
         self.is_openai_runtime = is_openai_runtime
         self.logger = logger
+        self.model = model
         self.client = self._setup_api_client()
         try:
             self.encoding = tiktoken.get_encoding(TOKENCODER_ENCODING_NAME)
         except Exception:
-            self.encoding = tiktoken.encoding_for_model(DEFAULT_OPENAI_MODEL)
+            self.encoding = tiktoken.encoding_for_model(self.model)
+
+    async def __aenter__(self) -> "OpenAISummarizerAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the underlying OpenAI client and its HTTP connection pool."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
 
     def _setup_api_client(self) -> Optional[AsyncOpenAI]:
         """Loads the OpenAI API key and creates an async client."""
@@ -41,9 +66,13 @@ class OpenAISummarizerAgent:
         """Calculates the number of tokens in a given text."""
         return len(self.encoding.encode(text))
 
-    def _split_text_into_chunks(self, text: str) -> List[str]:
+    def _get_token_counts(self, texts: List[str]) -> List[int]:
+        """Calculates the number of tokens for each text in a single, multi-threaded batch."""
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts, num_threads=TOKENIZER_NUM_THREADS)]
+
+    def _split_into_token_windows(self, text: str) -> List[str]:
         """
-        Splits text into chunks, each under the CHUNK_TARGET_SIZE token limit.
+        Splits text into raw windows of CHUNK_TARGET_SIZE tokens, regardless of word boundaries.
         """
         tokens = self.encoding.encode(text)
         chunks = []
@@ -55,18 +84,52 @@ class OpenAISummarizerAgent:
             start = end
         return chunks
 
-    async def _summarize_text(self, text: str, prompt: str) -> Optional[str]:
+    def _split_text_into_chunks(self, text: str) -> List[str]:
+        """
+        Splits text into chunks, each under the CHUNK_TARGET_SIZE token limit.
+        Sentences and lines are accumulated greedily so chunks end on a natural boundary;
+        only a single sentence longer than the limit is cut into raw token windows.
+        """
+        segments = [segment for segment in SENTENCE_BOUNDARY_PATTERN.split(text) if segment.strip()]
+        segment_token_counts = self._get_token_counts(segments)
+
+        chunks = []
+        current_segments = []
+        current_token_count = 0
+        for segment, segment_token_count in zip(segments, segment_token_counts):
+            if segment_token_count > CHUNK_TARGET_SIZE:
+                if current_segments:
+                    chunks.append(" ".join(current_segments))
+                    current_segments, current_token_count = [], 0
+                chunks.extend(self._split_into_token_windows(segment))
+                continue
+
+            if current_token_count + segment_token_count > CHUNK_TARGET_SIZE:
+                chunks.append(" ".join(current_segments))
+                current_segments, current_token_count = [], 0
+
+            current_segments.append(segment)
+            current_token_count += segment_token_count
+
+        if current_segments:
+            chunks.append(" ".join(current_segments))
+        return chunks
+
+    async def _summarize_text(self, text: str, prompt: str, max_tokens: int = FINAL_SUMMARY_MAX_TOKENS) -> Optional[str]:
         """
         Makes a single async call to the OpenAI API to summarize a piece of text.
+        The completion is capped at max_tokens, since every output token costs a forward pass.
         """
         try:
             self.logger.info("Making an async call to the OpenAI API...")
             response = await self.client.chat.completions.create(
-                model=DEFAULT_OPENAI_MODEL,
+                model=self.model,
                 messages=[
                     {"role": "system", "content": prompt},
                     {"role": "user", "content": f"Summarize this: {text}"}
-                ]
+                ],
+                max_tokens=max_tokens,
+                temperature=SUMMARY_TEMPERATURE
             )
             return response.choices[0].message.content
         except Exception as e:
@@ -80,7 +143,7 @@ class OpenAISummarizerAgent:
         for i, chunk in enumerate(chunks):
             self.logger.info(f"Preparing to summarize chunk {i+1}/{len(chunks)}...")
             prompt = "You are a summary assistant. Summarize this chunk of a larger transcription."
-            task = asyncio.create_task(self._summarize_text(chunk, prompt))
+            task = asyncio.create_task(self._summarize_text(chunk, prompt, CHUNK_SUMMARY_MAX_TOKENS))
             tasks.append(task)
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -99,17 +162,39 @@ class OpenAISummarizerAgent:
 
         return summaries
 
+    def _group_summaries_into_buckets(self, summaries: List[str], token_counts: List[int]) -> List[str]:
+        """
+        Groups summaries into buckets of at most CHUNK_TARGET_SIZE tokens using first-fit decreasing.
+        Each bucket keeps its summaries in their original order, and buckets are ordered by their
+        earliest summary so the combined text still follows the transcription.
+        """
+        buckets = []
+        bucket_sizes = []
+        for index in sorted(range(len(summaries)), key=lambda i: token_counts[i], reverse=True):
+            for bucket_index, bucket_size in enumerate(bucket_sizes):
+                if bucket_size + token_counts[index] <= CHUNK_TARGET_SIZE:
+                    buckets[bucket_index].append(index)
+                    bucket_sizes[bucket_index] += token_counts[index]
+                    break
+            else:
+                buckets.append([index])
+                bucket_sizes.append(token_counts[index])
+
+        ordered_buckets = sorted((sorted(bucket) for bucket in buckets), key=lambda bucket: bucket[0])
+        return ["\n\n".join(summaries[i] for i in bucket) for bucket in ordered_buckets]
+
     async def _recursive_summarize(self, text: str) -> Optional[str]:
         """
-        Recursively summarizes a long text by splitting it into chunks asynchronously.
+        Summarizes a long text by splitting it into chunks and then iteratively fanning the
+        chunk summaries back in, bucket by bucket, until they fit into a single final call.
         """
         token_count = self._get_token_count(text)
         self.logger.info(f"Starting recursive summarization for text with {token_count} tokens.")
 
+        final_prompt = "You are a summary assistant. Write a summary of the transcribed audio. Don't forget new lines."
         if token_count <= CHUNK_TARGET_SIZE:
-            prompt = "You are a summary assistant. Write a summary of the transcribed audio. Don't forget new lines."
             try:
-                result = await self._summarize_text(text, prompt)
+                result = await self._summarize_text(text, final_prompt)
                 if result:
                     return result
                 else:
@@ -130,21 +215,37 @@ class OpenAISummarizerAgent:
             self.logger.error("No successful summaries were generated from any chunks.")
             return None
 
-        combined_summary = " ".join(summaries)
+        # Fan the summaries in level by level. Each summary is already small, so only the
+        # summaries themselves are counted instead of re-encoding their concatenation.
+        token_counts = self._get_token_counts(summaries)
+        while sum(token_counts) > CHUNK_TARGET_SIZE:
+            buckets = self._group_summaries_into_buckets(summaries, token_counts)
+            self.logger.info(f"Combining {len(summaries)} summaries into {len(buckets)} buckets.")
+            level_summaries = await self._process_chunk_summaries(buckets)
+            if not level_summaries:
+                # Keep the best available result if a whole level fails (e.g., due to rate limits)
+                self.logger.info("Intermediate summarization failed, returning combined summary as fallback.")
+                return "\n\n".join(summaries)
+            level_token_counts = self._get_token_counts(level_summaries)
+            if sum(level_token_counts) >= sum(token_counts):
+                self.logger.warning("Intermediate summaries did not shrink, returning combined summary as fallback.")
+                return "\n\n".join(level_summaries)
+            summaries, token_counts = level_summaries, level_token_counts
+
+        combined_summary = "\n\n".join(summaries)
         self.logger.info("All chunks summarized. Now summarizing the combined summary.")
 
-        # Try to recursively summarize the combined summary, but if it fails (e.g., due to rate limits),
+        # Try to summarize the combined summary, but if it fails (e.g., due to rate limits),
         # return the current combined summary as the best available summary
         try:
-            recursive_result = await self._recursive_summarize(combined_summary)
-            if recursive_result:
-                return recursive_result
+            final_result = await self._summarize_text(combined_summary, final_prompt)
+            if final_result:
+                return final_result
             else:
-                # If the recursive call failed but we have a combined summary, return that as fallback
-                self.logger.info("Recursive summarization failed, returning combined summary as fallback.")
+                self.logger.info("Final summarization failed, returning combined summary as fallback.")
                 return combined_summary
         except Exception as e:
-            self.logger.warning(f"Recursive summarization failed due to: {e}. Returning combined summary as fallback.")
+            self.logger.warning(f"Final summarization failed due to: {e}. Returning combined summary as fallback.")
             # Return the combined summary as the best available result
             return combined_summary
 
@@ -9,69 +9,232 @@ import speech_recognition as sr
 from pydub import AudioSegment
 from pathlib import Path
 import logging
-from typing import Optional
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional, Tuple, Union
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import wave
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import aclosing
 import aiofiles
 from src.utils.common_logger import log_success_by_video_id, log_error_by_video_id
-from src.constants.service_constants import AUDIO_FILE_EXTENSION
-from src.constants.time_constants import AUDIO_CHUNK_LENGTH_MS
+from src.constants.service_constants import (
+    AUDIO_SAMPLE_RATE_HZ,
+    AUDIO_STT_POOL_SIZE_ENV,
+    MAX_AUDIO_STT_POOL_SIZE,
+    AUDIO_STT_THREADS_PER_CPU,
+    GOOGLE_CLOUD_SPEECH_ENV,
+    TRANSCRIPTION_LANGUAGE_CODE,
+    RECOGNIZER_ENERGY_THRESHOLD
+)
+from src.constants.time_constants import AUDIO_CHUNK_LENGTH_MS, GOOGLE_CLOUD_STREAM_FRAME_MS, GOOGLE_CLOUD_STREAM_MAX_AUDIO_MS
+
+try:
+    # Optional: only needed when streaming recognition through Google Cloud Speech is enabled
+    from google.cloud import speech
+except ImportError:
+    speech = None
 
 
 class AudioTranscriber:
     """
     Transcribes audio files to text by breaking them into manageable chunks.
     """
-    def __init__(self, logger: logging.Logger):
+    # Shared by all instances so per-video transcribers don't each spawn their own threads
+    _shared_executor: Optional[ThreadPoolExecutor] = None
+    _shared_executor_lock = threading.Lock()
+
+    def __init__(self, logger: logging.Logger, executor: Optional[Executor] = None, max_in_flight: Optional[int] = None):
         """
         Initializes the AudioTranscriber.
 
         Args:
             logger (logging.Logger): The logger instance for logging messages.
+            executor (Executor, optional): The executor for speech recognition calls.
+                Defaults to a pool shared by all transcribers.
+            max_in_flight (int, optional): The most chunks of one file submitted to the executor at once.
+                Defaults to the shared pool size.
         """
         self.logger = logger
+        # Chunks are built directly as sr.AudioData, so the recognizer is configured once
+        # with a fixed energy threshold and never recalibrates itself
         self.recognizer = sr.Recognizer()
-        # Use a thread pool for CPU-bound operations
-        self.executor = ThreadPoolExecutor(max_workers=4)
-
-    def _sanitize_filename_for_chunks(self, audio_file_prefix: str) -> str:
-        """Sanitize the filename for use in chunk names."""
-        # Remove any spaces or special characters that might be problematic for filenames
-        return audio_file_prefix.replace(" ", "_").replace("-", "_")
-
-    def _prepare_chunks_info(self, full_audio, chunk_length_ms: int, chunk_base_name: str):
-        """Prepare information about audio chunks."""
-        chunks_info = []
-        for i, start_ms in enumerate(range(0, len(full_audio), chunk_length_ms)):
-            end_ms = start_ms + chunk_length_ms
-            chunk = full_audio[start_ms:end_ms]
-            chunk_filename = f"{chunk_base_name}_chunk_{i}{AUDIO_FILE_EXTENSION}"
-            chunks_info.append((chunk, chunk_filename, i))
-        return chunks_info
-
-    def _export_chunks_to_files(self, chunks_info):
-        """Export all audio chunks to temporary files."""
-        for chunk, chunk_filename, i in chunks_info:
-            chunk.export(chunk_filename, format="wav")
-
-    async def _process_chunks_concurrently(self, chunks_info):
-        """Process transcription chunks concurrently."""
-        # Process transcriptions concurrently
-        loop = asyncio.get_event_loop()
-        tasks = []
-        for _, chunk_filename, chunk_index in chunks_info:
-            task = loop.run_in_executor(self.executor, self._transcribe_chunk_sync, chunk_filename, chunk_index)
-            tasks.append(task)
-
-        transcribed_chunks = await asyncio.gather(*tasks, return_exceptions=True)
-        return transcribed_chunks
-
-    def _transcribe_chunk_sync(self, chunk_filename: str, chunk_index: int) -> str:
+        self.recognizer.dynamic_energy_threshold = False
+        self.recognizer.energy_threshold = RECOGNIZER_ENERGY_THRESHOLD
+        # Speech recognition calls mostly wait on the network, so they run in a thread pool
+        self.executor = executor or self._get_shared_executor()
+        self.max_in_flight = max(1, max_in_flight or self._get_pool_size())
+        self.speech_client = self._setup_cloud_speech_client()
+
+    def _setup_cloud_speech_client(self):
+        """
+        Creates a Google Cloud Speech client if streaming recognition is enabled.
+        Returns None to use the free Google Speech Recognition endpoint instead.
+        """
+        if os.getenv(GOOGLE_CLOUD_SPEECH_ENV, "").strip().lower() not in ['true', '1', 't']:
+            return None
+        if speech is None:
+            self.logger.warning("Google Cloud Speech is enabled but google-cloud-speech is not installed. Using the free endpoint.")
+            return None
+        try:
+            return speech.SpeechClient()
+        except Exception as e:
+            self.logger.warning(f"Could not create a Google Cloud Speech client: {e}. Using the free endpoint.")
+            return None
+
+    @staticmethod
+    def _get_pool_size() -> int:
+        """Gets the shared pool size from the environment, defaulting to a multiple of the CPU count."""
+        default_pool_size = min(MAX_AUDIO_STT_POOL_SIZE, (os.cpu_count() or 1) * AUDIO_STT_THREADS_PER_CPU)
+        try:
+            return int(os.getenv(AUDIO_STT_POOL_SIZE_ENV, default_pool_size))
+        except ValueError:
+            return default_pool_size
+
+    @classmethod
+    def _get_shared_executor(cls) -> ThreadPoolExecutor:
+        """Returns the executor shared by all transcribers, creating it on first use."""
+        with cls._shared_executor_lock:
+            if cls._shared_executor is None:
+                cls._shared_executor = ThreadPoolExecutor(max_workers=cls._get_pool_size())
+            return cls._shared_executor
+
+    @classmethod
+    def shutdown_executor(cls, wait: bool = True):
+        """Shuts down the shared executor. A new one is created if a transcriber is used again."""
+        with cls._shared_executor_lock:
+            if cls._shared_executor is not None:
+                cls._shared_executor.shutdown(wait=wait)
+                cls._shared_executor = None
+
+    def _get_bytes_per_chunk(self, full_audio, chunk_length_ms: int) -> int:
+        """Get the number of PCM bytes in one audio chunk."""
+        return chunk_length_ms * full_audio.frame_rate // 1000 * full_audio.frame_width
+
+    def _prepare_chunks_info(self, full_audio, chunk_length_ms: int) -> Iterator[tuple]:
+        """
+        Yield the raw mono PCM data of each audio chunk, kept in memory for transcription.
+        Only used for audio the downloader did not already write as mono 16-bit WAV, which
+        the caller converts once. Each chunk is a zero-copy view into the PCM buffer, produced
+        only when the next chunk is submitted for transcription.
+        """
+        pcm_data = memoryview(full_audio.raw_data)
+        bytes_per_chunk = self._get_bytes_per_chunk(full_audio, chunk_length_ms)
+        for i, start_byte in enumerate(range(0, len(pcm_data), bytes_per_chunk)):
+            yield pcm_data[start_byte:start_byte + bytes_per_chunk], full_audio.frame_rate, full_audio.sample_width, i
+
+    def _get_streamable_wav_chunk_count(self, audio_path: Path, chunk_length_ms: int) -> Optional[int]:
+        """
+        Get the number of chunks of a mono 16-bit PCM WAV file that can be read in chunks without decoding.
+        Returns None if the audio file is not such a WAV file.
+        """
+        try:
+            with wave.open(str(audio_path), "rb") as wav_file:
+                if wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2:
+                    return None
+                frames_per_chunk = chunk_length_ms * wav_file.getframerate() // 1000
+                return -(-wav_file.getnframes() // frames_per_chunk)
+        except (wave.Error, EOFError):
+            return None
+
+    def _stream_wav_chunks(self, audio_path: Path, chunk_length_ms: int) -> Iterator[tuple]:
+        """
+        Yield the raw PCM data of each audio chunk, reading the WAV file one chunk at a time
+        so memory use stays flat regardless of the audio length.
+        """
+        with wave.open(str(audio_path), "rb") as wav_file:
+            sample_rate = wav_file.getframerate()
+            sample_width = wav_file.getsampwidth()
+            frames_per_chunk = chunk_length_ms * sample_rate // 1000
+            chunk_index = 0
+            while True:
+                chunk_data = wav_file.readframes(frames_per_chunk)
+                if not chunk_data:
+                    break
+                yield chunk_data, sample_rate, sample_width, chunk_index
+                chunk_index += 1
+
+    def _group_chunks_for_streaming(self, chunks_info, chunks_per_group: int) -> Iterator[tuple]:
+        """
+        Group consecutive chunks so each group fits into a single Google Cloud streaming request.
+        Yields (chunk_data_list, sample_rate, sample_width, group_index) tuples.
+        """
+        group = []
+        group_index = 0
+        for chunk_data, sample_rate, sample_width, _ in chunks_info:
+            group.append(chunk_data)
+            if len(group) == chunks_per_group:
+                yield group, sample_rate, sample_width, group_index
+                group = []
+                group_index += 1
+        if group:
+            yield group, sample_rate, sample_width, group_index
+
+    async def _process_chunks_concurrently(self, chunks_info, transcribe_func=None) -> AsyncIterator[tuple]:
+        """
+        Process transcription chunks concurrently, yielding (chunk_index, result) pairs as they complete.
+        Each chunk is transcribed with transcribe_func, which defaults to _transcribe_chunk_sync.
+        At most max_in_flight chunks are in flight, so a streamed audio file is only read as fast
+        as chunks are transcribed and memory stays bounded. Each chunk is read from chunks_info on
+        a worker thread, so reading the audio file never blocks the event loop. Chunks still
+        in flight are cancelled if the caller stops iterating early.
+        """
+        transcribe_func = transcribe_func or self._transcribe_chunk_sync
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        chunks_iterator = iter(chunks_info)
+
+        async def transcribe_chunk(raw_data, sample_rate, sample_width, chunk_index):
+            try:
+                return chunk_index, await loop.run_in_executor(
+                    self.executor, transcribe_func, raw_data, sample_rate, sample_width, chunk_index
+                )
+            except Exception as e:
+                return chunk_index, e
+            finally:
+                semaphore.release()
+
+        pending = set()
+        chunk_read = None
+        try:
+            while True:
+                await semaphore.acquire()
+                # Chunks are tuples, so None only marks the end of the audio. The read is shielded,
+                # so cancelling the caller leaves it running to completion rather than abandoned
+                chunk_read = loop.run_in_executor(None, next, chunks_iterator, None)
+                chunk_info = await asyncio.shield(chunk_read)
+                if chunk_info is None:
+                    semaphore.release()
+                    break
+                pending.add(asyncio.create_task(transcribe_chunk(*chunk_info)))
+                done = {task for task in pending if task.done()}
+                pending -= done
+                for task in done:
+                    yield task.result()
+
+            for task in asyncio.as_completed(pending):
+                yield await task
+        finally:
+            for task in pending:
+                task.cancel()
+            if chunk_read is not None:
+                # Closing the iterator while a worker thread is still inside next() would raise
+                # "generator already executing" in place of the original exception
+                await asyncio.wait([chunk_read])
+                if not chunk_read.cancelled():
+                    # A failed read is superseded by the exception already propagating
+                    chunk_read.exception()
+            if hasattr(chunks_iterator, "close"):
+                # Closes the audio file of a streamed WAV without waiting for garbage collection
+                chunks_iterator.close()
+
+    def _transcribe_chunk_sync(self, raw_data: Union[bytes, memoryview], sample_rate: int, sample_width: int, chunk_index: int) -> str:
         """
         Transcribes a single audio chunk using Google Speech Recognition.
 
         Args:
-            chunk_filename (str): The filename of the audio chunk to transcribe.
+            raw_data (Union[bytes, memoryview]): The raw PCM data of the audio chunk.
+            sample_rate (int): The sample rate of the PCM data in Hz.
+            sample_width (int): The number of bytes per sample.
             chunk_index (int): The index of the chunk, for logging purposes.
 
         Returns:
@@ -79,8 +242,8 @@ class AudioTranscriber:
         """
         self.logger.info(f"Chunk {chunk_index}: Starting transcription...")
         try:
-            with sr.AudioFile(chunk_filename) as source:
-                audio = self.recognizer.record(source)
+            # A chunk view is only copied out of the shared PCM buffer here, in the worker thread
+            audio = sr.AudioData(bytes(raw_data), sample_rate, sample_width)
             # Recognize the speech in the audio chunk
             text = self.recognizer.recognize_google(audio) + '\n'
             self.logger.info(f"Chunk {chunk_index}: Successfully transcribed ({len(text.strip())} chars)")
@@ -95,25 +258,59 @@ class AudioTranscriber:
             self.logger.error(f"An unexpected error occurred during transcription of chunk {chunk_index}: {e}")
             return "[unexpected transcription error]\n"
 
-    def _cleanup_temp_files(self, chunks_info):
-        """Clean up temporary chunk files."""
-        for _, chunk_filename, _ in chunks_info:
-            try:
-                if os.path.exists(chunk_filename):
-                    os.remove(chunk_filename)
-            except Exception as e:
-                self.logger.warning(f"Could not remove temporary file {chunk_filename}: {e}")
-
-    def _handle_transcription_results(self, transcribed_chunks):
-        """Handle transcription results, including errors."""
-        final_chunks = []
-        for i, chunk_result in enumerate(transcribed_chunks):
-            if isinstance(chunk_result, Exception):
-                self.logger.error(f"Error processing chunk {i}: {chunk_result}")
-                final_chunks.append("[transcription error]\n")
-            else:
-                final_chunks.append(chunk_result)
-        return final_chunks
+    def _transcribe_stream_sync(self, chunk_data_list: list, sample_rate: int, sample_width: int, group_index: int) -> str:
+        """
+        Transcribes a group of consecutive 16-bit PCM chunks over one Google Cloud Speech streaming call,
+        so the connection setup is paid once per group instead of once per chunk.
+
+        Args:
+            chunk_data_list (list): The raw PCM data of each chunk in the group.
+            sample_rate (int): The sample rate of the PCM data in Hz.
+            sample_width (int): The number of bytes per sample.
+            group_index (int): The index of the group, for logging purposes.
+
+        Returns:
+            str: The transcribed text, or an error message.
+        """
+        self.logger.info(f"Chunk group {group_index}: Starting streaming transcription of {len(chunk_data_list)} chunks...")
+        try:
+            streaming_config = speech.StreamingRecognitionConfig(
+                config=speech.RecognitionConfig(
+                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                    sample_rate_hertz=sample_rate,
+                    language_code=TRANSCRIPTION_LANGUAGE_CODE,
+                )
+            )
+            # Each request carries a short frame of audio rather than a whole chunk
+            bytes_per_frame = GOOGLE_CLOUD_STREAM_FRAME_MS * sample_rate // 1000 * sample_width
+            requests = (
+                speech.StreamingRecognizeRequest(audio_content=bytes(chunk_data[start_byte:start_byte + bytes_per_frame]))
+                for chunk_data in chunk_data_list
+                for start_byte in range(0, len(chunk_data), bytes_per_frame)
+            )
+            responses = self.speech_client.streaming_recognize(streaming_config, requests)
+            transcripts = [
+                result.alternatives[0].transcript
+                for response in responses
+                for result in response.results
+                if result.is_final and result.alternatives
+            ]
+            if not transcripts:
+                self.logger.warning(f"Chunk group {group_index}: Google Cloud Speech could not understand audio.")
+                return "[unintelligible]\n"
+            text = " ".join(transcript.strip() for transcript in transcripts) + '\n'
+            self.logger.info(f"Chunk group {group_index}: Successfully transcribed ({len(text.strip())} chars)")
+            return text
+        except Exception as e:
+            self.logger.error(f"An unexpected error occurred during streaming transcription of chunk group {group_index}: {e}")
+            return "[unexpected transcription error]\n"
+
+    def _handle_transcription_result(self, chunk_index: int, chunk_result) -> str:
+        """Handle a single transcription result, including errors."""
+        if isinstance(chunk_result, Exception):
+            self.logger.error(f"Error processing chunk {chunk_index}: {chunk_result}")
+            return "[transcription error]\n"
+        return chunk_result
 
     def _check_audio_file_exists(self, audio_path: Path, video_id: str = None) -> bool:
         """Check if the audio file exists."""
@@ -125,10 +322,65 @@ class AudioTranscriber:
             return False
         return True
 
-    def _create_chunk_base_name(self, audio_path: Path, video_id: str = None) -> str:
-        """Create a base name for audio chunks."""
-        audio_file_prefix = audio_path.stem
-        return f"{self._sanitize_filename_for_chunks(audio_file_prefix)}_{video_id}" if video_id else audio_file_prefix
+    def _decode_audio_file(self, audio_path: Path):
+        """
+        Decode an audio file that is not a mono 16-bit WAV into mono PCM at the transcription sample rate.
+        Decoding and resampling are CPU bound, so this runs on the executor rather than the event loop.
+        """
+        return AudioSegment.from_file(audio_path).set_channels(1).set_frame_rate(AUDIO_SAMPLE_RATE_HZ)
+
+    async def _prepare_transcription(self, audio_path: Path, chunk_length_ms: int) -> Tuple[Iterable[tuple], int, Callable]:
+        """
+        Prepare the audio chunks of a file for transcription.
+
+        Returns:
+            Tuple[Iterable[tuple], int, Callable]: The chunks to transcribe, the number of chunks,
+            and the function that transcribes a single chunk.
+        """
+        # Prepare chunks as in-memory PCM data, so no temporary files are needed.
+        # Mono 16-bit WAV files are streamed chunk by chunk; anything else is fully decoded first.
+        chunk_count = self._get_streamable_wav_chunk_count(audio_path, chunk_length_ms)
+        if chunk_count is not None:
+            chunks_info = self._stream_wav_chunks(audio_path, chunk_length_ms)
+            sample_width = 2
+        else:
+            loop = asyncio.get_running_loop()
+            full_audio = await loop.run_in_executor(self.executor, self._decode_audio_file, audio_path)
+            chunks_info = self._prepare_chunks_info(full_audio, chunk_length_ms)
+            chunk_count = -(-len(full_audio.raw_data) // self._get_bytes_per_chunk(full_audio, chunk_length_ms))
+            sample_width = full_audio.sample_width
+
+        transcribe_func = self._transcribe_chunk_sync
+        # Streaming recognition is configured for LINEAR16, so other sample widths use the free endpoint
+        if self.speech_client and sample_width != 2:
+            self.logger.warning(f"Audio of {audio_path} is not 16-bit PCM. Using the free endpoint instead of streaming.")
+        elif self.speech_client:
+            # Google Cloud streaming recognition takes batches of chunks over a single call
+            chunks_per_group = max(1, GOOGLE_CLOUD_STREAM_MAX_AUDIO_MS // chunk_length_ms)
+            chunks_info = self._group_chunks_for_streaming(chunks_info, chunks_per_group)
+            chunk_count = -(-chunk_count // chunks_per_group)
+            transcribe_func = self._transcribe_stream_sync
+
+        return chunks_info, chunk_count, transcribe_func
+
+    async def _transcribe_chunks_in_order(self, chunks_info, transcribe_func) -> AsyncIterator[str]:
+        """
+        Transcribe chunks concurrently, yielding each chunk's text in chunk order as soon as it and
+        all the chunks before it are done. Only out-of-order results are held back in memory.
+        """
+        completed_chunks = {}
+        next_chunk_index = 0
+        async with aclosing(self._process_chunks_concurrently(chunks_info, transcribe_func)) as chunk_results:
+            async for chunk_index, chunk_result in chunk_results:
+                completed_chunks[chunk_index] = self._handle_transcription_result(chunk_index, chunk_result)
+                while next_chunk_index in completed_chunks:
+                    yield completed_chunks.pop(next_chunk_index)
+                    next_chunk_index += 1
+
+    @staticmethod
+    def _is_successful_chunk(text: str) -> bool:
+        """Check if a chunk's text is an actual transcription rather than an error marker."""
+        return bool(text.strip()) and '[transcription error]' not in text
 
     async def transcribe_audio(self, audio_path: Path, chunk_length_ms: int = AUDIO_CHUNK_LENGTH_MS, video_id: str = None) -> Optional[str]:
         """
@@ -140,7 +392,7 @@ class AudioTranscriber:
         Args:
             audio_path (Path): The path to the audio file.
             chunk_length_ms (int): The length of each chunk in milliseconds.
-            video_id (str, optional): The video ID to create unique chunk filenames and avoid race conditions.
+            video_id (str, optional): The video ID for logging purposes.
 
         Returns:
             Optional[str]: The full transcribed text, or None if the file doesn't exist.
@@ -148,32 +400,21 @@ class AudioTranscriber:
         if not self._check_audio_file_exists(audio_path, video_id):
             return None
 
-        full_audio = AudioSegment.from_file(audio_path)
         self.logger.info(f"Starting audio transcription for {audio_path}...")
+        chunks_info, chunk_count, transcribe_func = await self._prepare_transcription(audio_path, chunk_length_ms)
 
-        # Create unique chunk filenames to avoid race conditions when multiple videos are being processed
-        chunk_base_name = self._create_chunk_base_name(audio_path, video_id)
-
-        # Prepare chunks
-        chunks_info = self._prepare_chunks_info(full_audio, chunk_length_ms, chunk_base_name)
-
-        # Process chunks concurrently
-        self.logger.info(f"Starting to process {len(chunks_info)} audio chunks concurrently...")
+        # Process chunks concurrently, placing each result at its chunk index as it completes
+        self.logger.info(f"Starting to process {chunk_count} audio chunks concurrently...")
+        final_chunks = [""] * chunk_count
+        async with aclosing(self._process_chunks_concurrently(chunks_info, transcribe_func)) as chunk_results:
+            async for chunk_index, chunk_result in chunk_results:
+                # Handle any exceptions during transcription
+                final_chunks[chunk_index] = self._handle_transcription_result(chunk_index, chunk_result)
 
-        # Export all chunks to temporary files first
-        self._export_chunks_to_files(chunks_info)
-
-        # Process transcriptions concurrently
-        transcribed_chunks = await self._process_chunks_concurrently(chunks_info)
-
-        # Clean up temporary files after processing
-        self._cleanup_temp_files(chunks_info)
-
-        # Handle any exceptions during transcription
-        final_chunks = self._handle_transcription_results(transcribed_chunks)
-
-        transcription_result = " ".join(final_chunks)
-        self.logger.info(f"Audio transcription finished for {audio_path}. Combined {len([t for t in final_chunks if t.strip() and '[transcription error]' not in t])} successful chunks.")
+        # Every chunk result already ends with a newline, so no separator is needed
+        transcription_result = "".join(final_chunks)
+        successful_chunk_count = sum(1 for text in final_chunks if self._is_successful_chunk(text))
+        self.logger.info(f"Audio transcription finished for {audio_path}. Combined {successful_chunk_count} successful chunks.")
 
         # Automatically log completion status with video_id if provided
         if video_id:
@@ -182,52 +423,58 @@ class AudioTranscriber:
 
         return transcription_result
 
-    async def _save_transcription_to_file(self, transcription_text: str, output_path: Path, video_id: str = None) -> Optional[Path]:
+    async def transcribe_audio_and_save(self, audio_path: Path, output_path: Path, chunk_length_ms: int = AUDIO_CHUNK_LENGTH_MS, video_id: str = None) -> Optional[Path]:
         """
-        Saves the transcription text to the specified output file.
+        Transcribes audio and saves the result to a file.
+
+        Each chunk's text is written as soon as it and all the chunks before it are transcribed,
+        so the full transcription is never held in memory. The text is written to a temporary
+        '.part' file that only replaces output_path once the transcription is complete.
 
         Args:
-            transcription_text (str): The transcribed text to save.
+            audio_path (Path): The path to the audio file to transcribe.
             output_path (Path): The path where the transcription should be saved.
+            chunk_length_ms (int): The length of each chunk in milliseconds.
             video_id (str, optional): The video ID for logging purposes.
 
         Returns:
             Optional[Path]: Path to the saved transcription file, or None if operation failed.
         """
+        if not self._check_audio_file_exists(audio_path, video_id):
+            return None
+
+        self.logger.info(f"Starting audio transcription for {audio_path}...")
+        chunks_info, chunk_count, transcribe_func = await self._prepare_transcription(audio_path, chunk_length_ms)
+        self.logger.info(f"Starting to process {chunk_count} audio chunks concurrently...")
+
+        partial_path = output_path.with_name(f"{output_path.name}.part")
+        transcription_length = 0
+        successful_chunk_count = 0
         try:
             # Create the output directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Save the transcription to the specified output path
-            async with aiofiles.open(output_path, "w", encoding="utf-8") as f:
-                await f.write(transcription_text)
+            # aclosing stops the chunks still in flight right away if a write fails
+            async with aiofiles.open(partial_path, "w", encoding="utf-8") as f, \
+                    aclosing(self._transcribe_chunks_in_order(chunks_info, transcribe_func)) as texts:
+                async for text in texts:
+                    await f.write(text)
+                    transcription_length += len(text)
+                    successful_chunk_count += self._is_successful_chunk(text)
 
-            if video_id:
-                log_success_by_video_id(self.logger, video_id, "Transcription saved to: %s", output_path)
-            return output_path
+            self.logger.info(f"Audio transcription finished for {audio_path}. Combined {successful_chunk_count} successful chunks.")
+            if not transcription_length:
+                os.remove(partial_path)
+                return None
+
+            os.replace(partial_path, output_path)
         except Exception as e:
             if video_id:
                 log_error_by_video_id(self.logger, video_id, "Failed to save transcription to %s: %s", output_path, e)
+            partial_path.unlink(missing_ok=True)
             return None
 
-    async def transcribe_audio_and_save(self, audio_path: Path, output_path: Path, chunk_length_ms: int = AUDIO_CHUNK_LENGTH_MS, video_id: str = None) -> Optional[Path]:
-        """
-        Transcribes audio and saves the result to a file.
-
-        Args:
-            audio_path (Path): The path to the audio file to transcribe.
-            output_path (Path): The path where the transcription should be saved.
-            chunk_length_ms (int): The length of each chunk in milliseconds.
-            video_id (str, optional): The video ID for logging purposes.
-
-        Returns:
-            Optional[Path]: Path to the saved transcription file, or None if operation failed.
-        """
-        # Transcribe the audio
-        transcription_text = await self.transcribe_audio(audio_path, chunk_length_ms, video_id)
-
-        if not transcription_text:
-            return None
-
-        # Save transcription to file using the separate function
-        return await self._save_transcription_to_file(transcription_text, output_path, video_id) 
+        if video_id:
+            log_success_by_video_id(self.logger, video_id, "Transcription completed (length: %d characters)", transcription_length)
+            log_success_by_video_id(self.logger, video_id, "Transcription saved to: %s", output_path)
+        return output_path
@@ -1,8 +1,28 @@
 """
 Module for discovering new YouTube videos to be processed (service architecture only).
 """
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import logging
+from src.constants.service_constants import DISCOVERY_MAX_CONCURRENT_FETCHES, DISCOVERY_LISTING_HEADROOM, DISCOVERY_CONCURRENCY_ENV
+
+
+def _get_discovery_concurrency() -> int:
+    """Gets the number of video details fetched at the same time during discovery from the environment."""
+    try:
+        return max(1, int(os.getenv(DISCOVERY_CONCURRENCY_ENV, DISCOVERY_MAX_CONCURRENT_FETCHES)))
+    except ValueError:
+        return DISCOVERY_MAX_CONCURRENT_FETCHES
+
+
+_discovery_concurrency = _get_discovery_concurrency()
+# Threads for the blocking yt-dlp details fallback, shared by all discovery jobs. Sized to the fetch window,
+# so the fallback neither waits on nor crowds out the event loop's default executor.
+_details_executor = ThreadPoolExecutor(max_workers=_discovery_concurrency, thread_name_prefix="video-details")
+
 
 class VideoDiscoverer:
     """
@@ -14,76 +34,154 @@ class VideoDiscoverer:
         self.metadata_fetcher = metadata_fetcher
         self.db_manager = db_manager
 
-    def _is_video_valid(self, video_details: Dict, max_length: Optional[int], apply_max_length_for_captionless_only: bool) -> bool:
+    def _is_video_valid(self, video_details: Dict, max_duration_seconds: Optional[float], apply_max_length_for_captionless_only: bool) -> bool:
         """
         Checks if a video with full details is valid for processing based on length and caption availability.
         """
         duration = video_details.get("duration")
         if duration is None:
-            self.logger.warning(f"Could not determine duration for '{video_details['video_title']}'. Skipping.")
+            self.logger.warning("Could not determine duration for '%s'. Skipping.", video_details['video_title'])
             return False
 
-        if max_length is None:
+        if max_duration_seconds is None or duration <= max_duration_seconds:
             return True
 
-        is_too_long = (duration / 60.0) > float(max_length)
+        if apply_max_length_for_captionless_only and video_details["has_captions"]:
+            self.logger.info("Video '%s' exceeds length limit, but has captions. It is valid.", video_details['video_title'])
+            return True
 
-        if is_too_long:
-            if apply_max_length_for_captionless_only and video_details["has_captions"]:
-                self.logger.info(f"Video '{video_details['video_title']}' exceeds length limit, but has captions. It is valid.")
-                return True
+        self.logger.info("Skipping video '%s' (Length: %.2f min) as it exceeds the %g min limit.",
+                         video_details['video_title'], duration / 60.0, max_duration_seconds / 60.0)
+        return False
 
-            self.logger.info(f"Skipping video '{video_details['video_title']}' (Length: {duration/60.0:.2f} min) as it exceeds the {max_length} min limit.")
+    def _is_entry_too_long(self, entry: Dict, max_duration_seconds: Optional[float], apply_max_length_for_captionless_only: bool) -> bool:
+        """
+        Checks if a lightweight channel entry is already known to exceed the length limit, so its full
+        details need not be fetched. Entries without a duration, or limits that depend on caption
+        availability, are left for the full validation.
+        """
+        entry_duration = entry.get("duration")
+        if not entry_duration or max_duration_seconds is None or apply_max_length_for_captionless_only:
             return False
 
-        return True
+        if entry_duration > max_duration_seconds:
+            self.logger.info("[%s] Skipping video (Length: %.2f min) as it exceeds the %g min limit.",
+                             entry['id'], entry_duration / 60.0, max_duration_seconds / 60.0)
+            return True
+        return False
+
+    async def _fetch_new_video_details(self, video_id: str) -> Optional[Dict]:
+        """
+        Fetches the full details of a video that is not yet in the database, off the event loop.
+        Returns None if the details could not be fetched.
+        """
+        self.logger.info("[%s] New video found. Fetching full video details...", video_id)
+        video_details = await self.metadata_fetcher.fetch_video_details_async(video_id, _details_executor)
+        if not video_details:
+            self.logger.warning("[%s] Could not fetch video details. Skipping.", video_id)
+        return video_details
+
+    async def _select_new_videos(self, video_entries: List[Dict], job_id: str, videos_needed: Optional[int],
+                                 max_duration_seconds: Optional[float], apply_max_length_for_captionless_only: bool) -> List[Dict]:
+        """
+        Selects up to videos_needed valid videos from the listed entries that are not yet in the database.
+
+        Video details are fetched concurrently, up to DISCOVERY_CONCURRENCY at a time,
+        but validated in channel order so the newest valid videos are still the ones selected.
+        """
+        valid_videos = []
+        listed_video_ids = [entry['id'] for entry in video_entries]
+
+        # Check which videos already exist in database in one query (to prevent duplicate discovery)
+        existing_video_ids = await asyncio.to_thread(self.db_manager.get_existing_video_ids, listed_video_ids)
+        if existing_video_ids:
+            self.logger.info("[Job: %s] %d listed videos already exist in database. Skipping them.",
+                             job_id, len(existing_video_ids))
+        # Skip videos whose listed duration already exceeds the limit before fetching their full details
+        video_ids = iter([
+            entry['id'] for entry in video_entries
+            if entry['id'] not in existing_video_ids
+            and not self._is_entry_too_long(entry, max_duration_seconds, apply_max_length_for_captionless_only)
+        ])
+
+        # A sliding window of in-flight fetches, consumed in the order the videos were listed
+        pending_fetches = deque()
+        try:
+            while True:
+                while len(pending_fetches) < _discovery_concurrency:
+                    video_id = next(video_ids, None)
+                    if video_id is None:
+                        break
+                    pending_fetches.append((video_id, asyncio.create_task(self._fetch_new_video_details(video_id))))
+
+                if not pending_fetches:
+                    break
+
+                video_id, fetch_task = pending_fetches.popleft()
+                video_details = await fetch_task
+                if not video_details:
+                    continue
+
+                if self._is_video_valid(video_details, max_duration_seconds, apply_max_length_for_captionless_only):
+                    has_captions = video_details.get("has_captions", False)
+                    if has_captions:
+                        self.logger.info("[%s] Video is valid and HAS CAPTIONS. Adding to discovery results.", video_id)
+                    else:
+                        self.logger.info("[%s] Video is valid and has NO CAPTIONS. Adding to discovery results.", video_id)
+                    # Add the job_id to the video details to pass to service
+                    video_details['job_id'] = job_id
+                    valid_videos.append(video_details)
+                else:
+                    self.logger.info("[%s] Video is invalid. Skipping.", video_id)
+
+                if videos_needed is not None and len(valid_videos) >= videos_needed:
+                    break
+        finally:
+            # Fetches scheduled ahead of the limit are no longer needed
+            for _, fetch_task in pending_fetches:
+                fetch_task.cancel()
 
-    def discover_videos(self, channel_name: str, job_id: str, num_videos_to_process: Optional[int], 
-                        max_video_length: Optional[int], apply_max_length_for_captionless_only: bool) -> List[Dict]:
+        return valid_videos
+
+    async def discover_videos(self, channel_name: str, job_id: str, num_videos_to_process: Optional[int],
+                              max_video_length: Optional[int], apply_max_length_for_captionless_only: bool) -> List[Dict]:
         """
         Discovers new, valid videos to be processed for service architecture.
         Checks database for existing videos.
+
+        With a video limit, only the newest DISCOVERY_LISTING_HEADROOM entries per requested video are
+        listed first, so large channels are not paged through in full. The full listing is only
+        fetched when those entries do not hold enough new, valid videos.
         """
-        self.logger.info(f"[Job: {job_id}] Starting video discovery for channel: {channel_name}")
-        valid_videos = []
-        
+        self.logger.info("[Job: %s] Starting video discovery for channel: %s", job_id, channel_name)
+
         video_limit_text = "all available" if num_videos_to_process is None else str(num_videos_to_process)
-        self.logger.info(f"[Job: {job_id}] Goal: Find {video_limit_text} videos from '{channel_name}' that are not yet in the database.")
+        self.logger.info("[Job: %s] Goal: Find %s videos from '%s' that are not yet in the database.",
+                         job_id, video_limit_text, channel_name)
+
+        # The length limit is given in minutes, converted once here and compared in seconds for every video
+        max_duration_seconds = None if max_video_length is None else float(max_video_length) * 60.0
 
         # Get video entries from the channel
-        video_entries = self.metadata_fetcher.get_video_entries()
-
-        for entry in video_entries:
-            video_id = entry['id']
-            
-            # Check if video already exists in database (to prevent duplicate discovery)
-            existing_video = self.db_manager.get_video(video_id)
-            if existing_video:
-                self.logger.info(f"[{video_id}] Video already exists in database. Skipping.")
-                continue
-
-            self.logger.info(f"[{video_id}] New video found. Fetching full video details...")
-            video_details = self.metadata_fetcher.fetch_video_details(video_id)
-
-            if not video_details:
-                self.logger.warning(f"[{video_id}] Could not fetch video details. Skipping.")
-                continue
-
-            if self._is_video_valid(video_details, max_video_length, apply_max_length_for_captionless_only):
-                has_captions = video_details.get("has_captions", False)
-                if has_captions:
-                    self.logger.info(f"[{video_id}] Video is valid and HAS CAPTIONS. Adding to discovery results.")
-                else:
-                    self.logger.info(f"[{video_id}] Video is valid and has NO CAPTIONS. Adding to discovery results.")
-                # Add the job_id to the video details to pass to service
-                video_details['job_id'] = job_id
-                valid_videos.append(video_details)
-            else:
-                self.logger.info(f"[{video_id}] Video is invalid. Skipping.")
-
-            if num_videos_to_process is not None and len(valid_videos) >= num_videos_to_process:
-                self.logger.info(f"[Job: {job_id}] Reached the limit of {num_videos_to_process} new videos to process.")
-                break
-
-        self.logger.info(f"[Job: {job_id}] Discovery complete. Found {len(valid_videos)} new videos.")
-        return valid_videos 
+        listing_limit = None if num_videos_to_process is None else num_videos_to_process * DISCOVERY_LISTING_HEADROOM
+        video_entries = await asyncio.to_thread(self.metadata_fetcher.get_video_entries, listing_limit)
+        valid_videos = await self._select_new_videos(
+            video_entries, job_id, num_videos_to_process,
+            max_duration_seconds, apply_max_length_for_captionless_only
+        )
+
+        if listing_limit is not None and len(valid_videos) < num_videos_to_process and len(video_entries) >= listing_limit:
+            self.logger.info("[Job: %s] The newest %d entries held %d new videos. Listing the whole channel.",
+                             job_id, listing_limit, len(valid_videos))
+            listed_video_ids = {entry['id'] for entry in video_entries}
+            all_video_entries = await asyncio.to_thread(self.metadata_fetcher.get_video_entries)
+            valid_videos += await self._select_new_videos(
+                [entry for entry in all_video_entries if entry['id'] not in listed_video_ids],
+                job_id, num_videos_to_process - len(valid_videos),
+                max_duration_seconds, apply_max_length_for_captionless_only
+            )
+
+        if num_videos_to_process is not None and len(valid_videos) >= num_videos_to_process:
+            self.logger.info("[Job: %s] Reached the limit of %d new videos to process.", job_id, num_videos_to_process)
+        self.logger.info("[Job: %s] Discovery complete. Found %d new videos.", job_id, len(valid_videos))
+        return valid_videos
@@ -1,30 +1,160 @@
 """
 Module for downloading YouTube audio and captions.
 """
+import asyncio
 import os
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import logging
-from yt_dlp import YoutubeDL
-import aiofiles
 from src.utils.common_logger import log_success_by_video_id, log_error_by_video_id, log_warning_by_video_id, sanitize_filename
+from src.utils.vtt_parser import VttParser
+from src.utils.youtube_dl_cache import ThreadLocalYoutubeDL
+from src.constants.service_constants import (
+    AUDIO_SAMPLE_RATE_HZ,
+    CAPTION_FILE_EXTENSION,
+    DOWNLOAD_MAX_CONCURRENT,
+    DEFAULT_DOWNLOAD_CONCURRENT_FRAGMENTS,
+    DOWNLOAD_CONCURRENT_FRAGMENTS_ENV,
+    DOWNLOAD_HTTP_CHUNK_SIZE,
+    DOWNLOAD_RETRIES,
+    MIN_VALID_AUDIO_BYTES,
+    MIN_VALID_CAPTION_BYTES,
+    YOUTUBE_RATE_LIMIT_ERROR,
+    YTDLP_CONCURRENCY_ENV,
+)
+from src.constants.time_constants import BACKOFF_MULTIPLIER, YOUTUBE_RATE_LIMIT_PAUSE
+
+
+def _get_download_concurrency() -> int:
+    """Gets the number of videos downloaded from YouTube at the same time from the environment."""
+    try:
+        return max(1, int(os.getenv(YTDLP_CONCURRENCY_ENV, DOWNLOAD_MAX_CONCURRENT)))
+    except ValueError:
+        return DOWNLOAD_MAX_CONCURRENT
+
+
+class YouTubeRateLimiter:
+    """
+    Tracks YouTube rate limiting (HTTP 429) seen by any download, so new downloads pause for a
+    while instead of piling more requests onto the limit.
+    """
+    def __init__(self):
+        self._resume_at = 0.0
+
+    def record_error(self, error: Exception) -> bool:
+        """Starts a pause if the error is a YouTube rate limit response. Returns True if it was."""
+        if YOUTUBE_RATE_LIMIT_ERROR not in str(error):
+            return False
+        self._resume_at = time.monotonic() + YOUTUBE_RATE_LIMIT_PAUSE
+        return True
+
+    async def wait(self):
+        """Waits until the rate limit pause, if any, is over, including pauses started while waiting."""
+        while (delay := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+
+# Shared by all downloaders in the process, since YouTube rate limits per client, not per downloader
+youtube_rate_limiter = YouTubeRateLimiter()
+
+
+def _get_ffmpeg_threads() -> int:
+    """
+    Splits the CPUs between the ffmpeg conversions that can run at once, one per download slot,
+    so concurrent conversions do not each start a thread per CPU and oversubscribe the machine.
+    """
+    return max(1, (os.cpu_count() or 1) // _get_download_concurrency())
+
+
+def _get_concurrent_fragment_downloads() -> int:
+    """Gets the number of fragments to download in parallel from the environment, so busy channels can raise it."""
+    try:
+        return int(os.getenv(DOWNLOAD_CONCURRENT_FRAGMENTS_ENV, DEFAULT_DOWNLOAD_CONCURRENT_FRAGMENTS))
+    except ValueError:
+        return DEFAULT_DOWNLOAD_CONCURRENT_FRAGMENTS
 
 
 class AudioDownloader:
     """Handles the downloading of audio from YouTube videos."""
     def __init__(self, logger: logging.Logger):
         self.logger = logger
+        # Each worker thread reuses its own YoutubeDL instance, so extractors are set up once per thread
+        # and several downloads can run at the same time. Only the output template changes per download.
+        self._ydl = ThreadLocalYoutubeDL({
+            'format': 'bestaudio/best',  # Download the best available audio
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'wav',      # Convert to WAV format
+                'preferredquality': '0',      # Highest quality
+            }],
+            # Resample and downmix once here, so transcription can stream the WAV file as-is
+            'postprocessor_args': [
+                '-ar', str(AUDIO_SAMPLE_RATE_HZ),  # Sampling rate expected by speech recognition
+                '-ac', '1',  # Mono
+                '-acodec', 'pcm_s16le',  # 16-bit PCM (LINEAR16)
+                '-threads', str(_get_ffmpeg_threads()),
+            ],
+            'prefer_ffmpeg': True,
+            'extractaudio': True,
+            'keepvideo': False,
+            # Fetch the fragments of DASH/HLS audio in parallel and in large HTTP chunks
+            'concurrent_fragment_downloads': _get_concurrent_fragment_downloads(),
+            'http_chunk_size': DOWNLOAD_HTTP_CHUNK_SIZE,
+            # Retry failed requests and fragments with exponential backoff
+            'retries': DOWNLOAD_RETRIES,
+            'fragment_retries': DOWNLOAD_RETRIES,
+            'retry_sleep_functions': {
+                'http': lambda attempt: BACKOFF_MULTIPLIER ** attempt,
+                'fragment': lambda attempt: BACKOFF_MULTIPLIER ** attempt,
+            },
+        })
+
+    def _check_file_exists_and_log(self, filepath: Path, title: str, video_id: str, file_type: str,
+                                   min_valid_bytes: int = MIN_VALID_AUDIO_BYTES) -> Optional[Path]:
+        """
+        Check if the file already exists and log appropriately.
+        A file smaller than min_valid_bytes is left over from a failed download, so it is removed
+        and treated as missing. A single stat call gives both the existence and the size.
+        """
+        try:
+            file_size = filepath.stat().st_size
+        except FileNotFoundError:
+            return None
+
+        if file_size < min_valid_bytes:
+            self.logger.warning(f"{file_type} '{title}' exists but is only {file_size} bytes, likely from a failed download. Downloading again.")
+            filepath.unlink(missing_ok=True)
+            return None
+
+        self.logger.info(f"{file_type} '{title}' already exists. Skipping download.")
+        # Log the completion status with video_id format too
+        log_success_by_video_id(self.logger, video_id, f"{file_type} downloaded successfully to: %s", filepath)
+        return filepath
+
+    def _build_audio_paths(self, video_title: str, upload_date: str, video_id: str, path_to_save_audio: Path) -> Tuple[Path, str]:
+        """
+        Builds the audio file path and the matching yt-dlp output template from one sanitized base name.
+
+        Returns:
+            Tuple[Path, str]: The final WAV file path and the yt-dlp output template.
+        """
+        base_path = path_to_save_audio / f"{sanitize_filename(video_title)}-{upload_date}-{video_id}"
+        # Note: yt-dlp will add the .wav extension automatically
+        return base_path.with_name(f"{base_path.name}.wav"), f"{base_path}.%(ext)s"
 
-    def _check_file_exists_and_log(self, filepath: Path, title: str, video_id: str, file_type: str) -> Optional[Path]:
-        """Check if the file already exists and log appropriately."""
-        if filepath.exists():
-            self.logger.info(f"{file_type} '{title}' already exists. Skipping download.")
-            # Log the completion status with video_id format too
-            log_success_by_video_id(self.logger, video_id, f"{file_type} downloaded successfully to: %s", filepath)
-            return filepath
-        return None
+    def find_existing_audio(self, video_title: str, upload_date: str, video_id: str, path_to_save_audio: Path) -> Optional[Path]:
+        """
+        Returns the audio file of a video if it was already downloaded, using only a stat call.
+        Lets callers skip the download slot and any network request for videos already on disk.
+        """
+        audio_filepath, _ = self._build_audio_paths(video_title, upload_date, video_id, path_to_save_audio)
+        return self._check_file_exists_and_log(audio_filepath, video_title, video_id, "Audio")
 
-    def download_audio(self, youtube_video_url: str, video_title: str, upload_date: str, video_id: str, path_to_save_audio: Path) -> Optional[Path]:
+    def download_audio(self, youtube_video_url: str, video_title: str, upload_date: str, video_id: str, path_to_save_audio: Path,
+                       video_info: Optional[Dict] = None) -> Optional[Path]:
         """
         Downloads audio from a YouTube URL and converts to WAV format using yt-dlp.
 
@@ -34,38 +164,25 @@ class AudioDownloader:
             upload_date (str): Upload date of the video
             video_id (str): The video ID for logging purposes
             path_to_save_audio (Path): Path where the audio will be saved
+            video_info (Optional[Dict]): Video info already extracted by yt-dlp, e.g. during the caption
+                                         download, so the video is not extracted a second time
 
         Returns:
             Optional[Path]: Path to the downloaded audio in WAV format, or None if failed
         """
-        sanitized_filename = f"{sanitize_filename(video_title)}-{upload_date}-{video_id}"
-        # Note: yt-dlp will add the .wav extension automatically
-        audio_filepath = path_to_save_audio / f"{sanitized_filename}.wav"
-
-        # Check if file already exists
-        existing_file = self._check_file_exists_and_log(audio_filepath, video_title, video_id, "Audio")
+        existing_file = self.find_existing_audio(video_title, upload_date, video_id, path_to_save_audio)
         if existing_file:
             return existing_file
-
-        ydl_opts = {
-            'format': 'bestaudio/best',  # Download the best available audio
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',      # Convert to WAV format
-                'preferredquality': '0',      # Highest quality
-            }],
-            'postprocessor_args': [
-                '-ar', '16000',  # Optional: set audio sampling rate
-            ],
-            'prefer_ffmpeg': True,
-            'extractaudio': True,
-            'keepvideo': False,
-            'outtmpl': str(path_to_save_audio / f'{sanitized_filename}.%(ext)s'),
-        }
+        audio_filepath, outtmpl = self._build_audio_paths(video_title, upload_date, video_id, path_to_save_audio)
 
         try:
             self.logger.info(f"Downloading audio to {audio_filepath}...")
-            with YoutubeDL(ydl_opts) as ydl:
+            ydl = self._ydl.get()
+            ydl.params['outtmpl'] = {'default': outtmpl}
+            if video_info is not None:
+                # Select and download the audio format from the already extracted info
+                ydl.process_ie_result(video_info, download=True)
+            else:
                 ydl.download([youtube_video_url])
 
             self.logger.info("Audio download and conversion successful.")
@@ -74,6 +191,8 @@ class AudioDownloader:
             log_success_by_video_id(self.logger, video_id, "Audio downloaded successfully to: %s", audio_filepath)
             return audio_filepath
         except Exception as e:
+            if youtube_rate_limiter.record_error(e):
+                self.logger.warning(f"[{video_id}] Rate limited by YouTube. Pausing new downloads for {YOUTUBE_RATE_LIMIT_PAUSE} seconds.")
             self.logger.error(f'Error downloading or converting audio: {e}')
             log_error_by_video_id(self.logger, video_id, "Failed to download or convert audio")
             return None
@@ -83,6 +202,19 @@ class CaptionsDownloader:
     """Handles downloading and processing YouTube captions to clean text transcription."""
     def __init__(self, logger: logging.Logger):
         self.logger = logger
+        # Each worker thread reuses its own YoutubeDL instance for caption downloads.
+        # Only the output template changes per call.
+        self._ydl = ThreadLocalYoutubeDL({
+            'skip_download': True,
+            # Request both kinds, yt-dlp picks user-uploaded subtitles over auto-generated captions
+            'writesubtitles': True,
+            'writeautomaticsub': True,
+            'subtitleslangs': ['en'],
+            'subtitlesformat': 'vtt',
+            'quiet': True,
+            'retries': DOWNLOAD_RETRIES,
+            'retry_sleep_functions': {'http': lambda attempt: BACKOFF_MULTIPLIER ** attempt},
+        })
 
     def download_captions(self, video_id: str, destination_path: Path) -> Optional[Path]:
         """
@@ -90,75 +222,66 @@ class CaptionsDownloader:
         Returns the path to the downloaded .vtt file if successful, otherwise None.
         Prioritizes user-uploaded subtitles, falls back to auto-generated captions.
         """
+        return self.download_captions_with_info(video_id, destination_path)[0]
+
+    def download_captions_with_info(self, video_id: str, destination_path: Path) -> Tuple[Optional[Path], Optional[Dict]]:
+        """
+        Downloads the English captions for a video like download_captions, also returning the
+        video info yt-dlp extracted on the way, so a fallback audio download need not extract it again.
+
+        Returns:
+            Tuple[Optional[Path], Optional[Dict]]: The .vtt file path, or None if no captions were
+            downloaded, and the extracted video info, or None if the extraction failed.
+        """
+        info = None
         self.logger.info(f"Attempting to download captions for video ID: {video_id}")
 
         url = f"https://www.youtube.com/watch?v={video_id}"
 
-        # First, let's get info to check what's available
-        info_ydl_opts = {
-            'skip_download': True,
-            'writesubtitles': False,
-            'writeautomaticsub': False,
-            'subtitleslangs': ['en'],
-            'quiet': True,
-        }
-
         try:
-            with YoutubeDL(info_ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-            manual_subs = info.get("subtitles", {}).get("en")
-            auto_subs = info.get("automatic_captions", {}).get("en")
-
             # Define the path template
             outtmpl = str(destination_path / f"{video_id}.%(ext)s")
 
-            if manual_subs:  # User-uploaded subtitles available
-                self.logger.info(f"[{video_id}] User-uploaded captions available. Downloading...")
-                download_ydl_opts = {
-                    'skip_download': True,
-                    'writesubtitles': True,
-                    'subtitleslangs': ['en'],
-                    'subtitlesformat': 'vtt',
-                    'outtmpl': outtmpl,
-                    'quiet': True,
-                }
-                with YoutubeDL(download_ydl_opts) as ydl:
-                    ydl.download([url])
-
-                # Look for the downloaded file
-                for file in destination_path.glob(f"{video_id}.en.vtt"):
-                    self.logger.info(f"Successfully downloaded user-uploaded captions to {file}")
-                    return file
-            elif auto_subs:  # Auto-generated captions available
-                self.logger.info(f"[{video_id}] Auto-generated captions available. Downloading...")
-                download_ydl_opts = {
-                    'skip_download': True,
-                    'writeautomaticsub': True,
-                    'subtitleslangs': ['en'],
-                    'subtitlesformat': 'vtt',
-                    'outtmpl': outtmpl,
-                    'quiet': True,
-                }
-                with YoutubeDL(download_ydl_opts) as ydl:
-                    ydl.download([url])
-
-                # Look for the downloaded auto-caption file
-                for file in destination_path.glob(f"{video_id}.en.vtt"):
-                    self.logger.info(f"Successfully downloaded auto-generated captions to {file}")
-                    return file
-            else:
+            # A single extraction both finds the available captions and writes the preferred ones
+            ydl = self._ydl.get()
+            ydl.params['outtmpl'] = {'default': outtmpl}
+            info = ydl.extract_info(url, download=True)
+
+            if not (info.get("requested_subtitles") or {}).get("en"):
                 self.logger.warning(f"[{video_id}] No captions (manual or auto-generated) available.")
                 log_warning_by_video_id(self.logger, video_id, "No captions available for download.")
-                return None
+                return None, info
+
+            caption_type = "user-uploaded" if info.get("subtitles", {}).get("en") else "auto-generated"
+            # The output template fixes the file name, so check for it directly instead of scanning the directory
+            caption_path = destination_path / f"{video_id}{CAPTION_FILE_EXTENSION}"
+            try:
+                caption_size = caption_path.stat().st_size
+            except FileNotFoundError:
+                caption_size = None
+
+            if caption_size is not None and caption_size >= MIN_VALID_CAPTION_BYTES:
+                self.logger.info(f"Successfully downloaded {caption_type} captions to {caption_path}")
+                return caption_path, info
+            if caption_size is not None:
+                # A caption file this small holds no cues, so it cannot replace audio transcription
+                self.logger.warning(f"[{video_id}] Caption file is only {caption_size} bytes. Discarding it.")
+                caption_path.unlink(missing_ok=True)
 
             # If we reach here, the download was attempted but file wasn't found
             log_warning_by_video_id(self.logger, video_id, "Caption download was attempted but no VTT file was found.")
-            return None
+            return None, info
 
         except Exception as e:
+            if youtube_rate_limiter.record_error(e):
+                self.logger.warning(f"[{video_id}] Rate limited by YouTube. Pausing new downloads for {YOUTUBE_RATE_LIMIT_PAUSE} seconds.")
             self.logger.error(f"An error occurred while downloading captions for {video_id}: {e}")
-            return None
+            return None, info
+
+    def _convert_captions_file(self, vtt_path: Path, transcription_path: Path):
+        """Streams the cleaned VTT lines into the transcription file, then removes the raw VTT file."""
+        VttParser.write_plain_text(vtt_path, transcription_path)
+        os.remove(vtt_path)
 
     async def process_captions_to_transcription(self, vtt_path: Path, transcription_path: Path) -> bool:
         """
@@ -172,22 +295,8 @@ class CaptionsDownloader:
             True if successful, False otherwise
         """
         try:
-            async with aiofiles.open(vtt_path, "r", encoding="utf-8") as f:
-                lines = (await f.read()).splitlines()
-
-            # Clean the VTT content (same logic as in VideoProcessor)
-            cleaned_lines = [
-                line.strip() for line in lines
-                if "-->" not in line and not line.startswith(("WEBVTT", "Kind:", "Language:")) and line.strip()
-            ]
-            transcription_text = " ".join(cleaned_lines)
-
-            # Save the cleaned transcription
-            async with aiofiles.open(transcription_path, "w", encoding="utf-8") as f:
-                await f.write(transcription_text)
-
-            # Remove the raw VTT file after processing
-            os.remove(vtt_path)
+            # Convert and clean up in one worker thread, so neither the file I/O nor the unlink blocks the event loop
+            await asyncio.to_thread(self._convert_captions_file, vtt_path, transcription_path)
 
             self.logger.info(f"Caption file processed successfully. Saved transcription to {transcription_path}")
             return True
@@ -198,28 +307,100 @@ class CaptionsDownloader:
 
 class VideoDataDownloader:
     """Simple coordinator that downloads either audio or captions based on availability."""
+    # Only a few downloads touch YouTube at a time across all coordinators in the process,
+    # since more concurrent downloads get throttled or blocked by YouTube
+    _download_concurrency = _get_download_concurrency()
+    # Created per event loop on first use, since a semaphore is bound to the loop it first waits on
+    _download_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.audio_downloader = AudioDownloader(logger)
         self.captions_downloader = CaptionsDownloader(logger)
+        # Downloads run on their own worker threads (ffmpeg conversion already runs in its own process).
+        # A dedicated pool keeps minutes-long downloads from occupying the event loop's default executor.
+        self._download_executor = ThreadPoolExecutor(max_workers=self._download_concurrency, thread_name_prefix="download")
+
+    @classmethod
+    def _get_download_semaphore(cls) -> asyncio.Semaphore:
+        """Gets the download slots shared by all coordinators on the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = cls._download_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._download_semaphores[loop] = asyncio.Semaphore(cls._download_concurrency)
+        return semaphore
+
+    async def _acquire_download_slot(self) -> asyncio.Semaphore:
+        """
+        Takes one of the download slots and returns the semaphore to release it on.
+        Any YouTube rate limit pause is waited out before queueing for a slot and again once
+        the slot is taken, since a pause may start while a download is still queued.
+        """
+        semaphore = self._get_download_semaphore()
+        await youtube_rate_limiter.wait()
+        await semaphore.acquire()
+        try:
+            await youtube_rate_limiter.wait()
+        except BaseException:
+            semaphore.release()
+            raise
+        return semaphore
+
+    def shutdown(self, wait: bool = True):
+        """Shuts down the download worker threads."""
+        self._download_executor.shutdown(wait=wait)
 
     async def download(self, has_captions: bool, video_id: str, video_title: str, upload_date: str, video_paths: dict) -> Optional[Path]:
         """
         Downloads either captions or audio based on the has_captions flag.
         """
+        # Without an upload date the file names cannot be built, so a download would only fail later
+        if not upload_date:
+            log_error_by_video_id(self.logger, video_id, "Missing upload date. Skipping download.")
+            return None
+
+        loop = asyncio.get_running_loop()
+        video_info = None
         if has_captions:
-            # Download and process captions to transcription
-            vtt_path = self.captions_downloader.download_captions(video_id, video_paths["transcription"].parent)
+            # Captions already turned into a transcription need neither a caption nor an audio download
+            if video_paths["transcription"].exists():
+                self.logger.info(f"[{video_id}] Transcription from captions already exists. Skipping download.")
+                return video_paths["transcription"]
+
+            # Download captions, holding a download slot only for the network part
+            download_semaphore = await self._acquire_download_slot()
+            try:
+                vtt_path, video_info = await loop.run_in_executor(
+                    self._download_executor, self.captions_downloader.download_captions_with_info, video_id, video_paths["transcription"].parent
+                )
+            finally:
+                download_semaphore.release()
+
+            # Process captions to transcription outside the download slot, so conversions of
+            # many captioned videos run alongside the next downloads
             if vtt_path:
                 success = await self.captions_downloader.process_captions_to_transcription(vtt_path, video_paths["transcription"])
                 if success:
                     return video_paths["transcription"]
 
-        # If captions not available or processing failed, download audio
-        return self.audio_downloader.download_audio(
-            f"https://www.youtube.com/watch?v={video_id}",
-            video_title,
-            upload_date,
-            video_id,
-            video_paths["audio"].parent
-        ) 
+        # Audio already on disk needs neither a download slot nor a request to YouTube
+        existing_audio = self.audio_downloader.find_existing_audio(video_title, upload_date, video_id, video_paths["audio"].parent)
+        if existing_audio:
+            return existing_audio
+
+        # If captions not available or processing failed, download audio,
+        # reusing the video info from the caption attempt when there was one
+        download_semaphore = await self._acquire_download_slot()
+        try:
+            return await loop.run_in_executor(
+                self._download_executor,
+                self.audio_downloader.download_audio,
+                f"https://www.youtube.com/watch?v={video_id}",
+                video_title,
+                upload_date,
+                video_id,
+                video_paths["audio"].parent,
+                video_info
+            )
+        finally:
+            download_semaphore.release()
@@ -1,15 +1,44 @@
 """
 Module for fetching video metadata from YouTube.
 """
-from typing import List, Dict, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import List, Dict, Optional, Tuple
 import logging
-from yt_dlp import YoutubeDL
+from src.utils.youtube_dl_cache import ThreadLocalYoutubeDL
+from src.constants.service_constants import (
+    YOUTUBE_PLAYER_API_URL,
+    YOUTUBE_PLAYER_API_CLIENT_NAME,
+    YOUTUBE_PLAYER_API_CLIENT_VERSION,
+    YOUTUBE_PLAYER_API_LIMIT_PER_HOST,
+    VIDEO_DETAILS_CACHE_SIZE,
+)
+from src.constants.time_constants import DEFAULT_REQUEST_TIMEOUT, YOUTUBE_PLAYER_API_DEFAULT_RETRY_AFTER, VIDEO_DETAILS_CACHE_TTL, VIDEO_DETAILS_FAILURE_CACHE_TTL
+
+try:
+    # Optional: without it, video details are always fetched through yt-dlp
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 class VideoMetadataFetcher:
     """Fetches video metadata from a YouTube channel efficiently."""
+    # YoutubeDL instances are shared by all fetchers, one per thread, so a new fetcher per
+    # discovery job does not set up the extractors again
+    _entries_ydl = ThreadLocalYoutubeDL({"quiet": True, "extract_flat": True, "dump_single_json": True})
+    _details_ydl = ThreadLocalYoutubeDL({"quiet": True, "skip_download": True})
+    # Fetched video details by video ID, as (expiry time, details or None for a failed fetch), in least recently used order
+    _video_details_cache: "OrderedDict[str, Tuple[float, Optional[Dict]]]" = OrderedDict()
+
     def __init__(self, channel_name: str, logger: Optional[logging.Logger] = None):
         self.channel_name = channel_name
         self.logger = logger
+        # Shared HTTP session for the YouTube player API, created on first use inside the event loop
+        self._session = None
+        # Event loop time before which player API requests wait, set when YouTube rate limits us
+        self._player_api_resume_at = 0.0
 
     def _get_channel_url(self) -> str:
         """Constructs the full YouTube channel URL from a channel name."""
@@ -21,19 +50,24 @@ class VideoMetadataFetcher:
             # Try the @ format first as it's most common now
             return f"https://www.youtube.com/@{clean_name}"
 
-    def get_video_entries(self) -> List[Dict]:
+    def get_video_entries(self, limit_hint: Optional[int] = None) -> List[Dict]:
         """
         Retrieves a fast, lightweight list of video entries from the channel.
+
+        Args:
+            limit_hint (Optional[int]): The most entries needed, newest first. yt-dlp stops paging
+                through the channel once it has listed them. None lists every entry.
         """
         channel_url = self._get_channel_url()
         self.logger.info(f"Fetching lightweight list of video entries for '{self.channel_name.strip()}'...")
-        ydl_opts = {"quiet": True, "extract_flat": True, "dump_single_json": True}
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                playlist_info = ydl.extract_info(f"{channel_url}/videos", download=False)
-                entries = playlist_info.get("entries", [])
-                self.logger.info(f"Found {len(entries)} video entries.")
-                return entries
+            ydl = self._entries_ydl.get()
+            # Set on every call, as the instance is reused by this thread for later listings
+            ydl.params["playlistend"] = limit_hint
+            playlist_info = ydl.extract_info(f"{channel_url}/videos", download=False)
+            entries = list(playlist_info.get("entries") or [])[:limit_hint]
+            self.logger.info(f"Found {len(entries)} video entries.")
+            return entries
         except Exception as e:
             self.logger.error(f"Could not retrieve video entries for {channel_url}: {e}")
             return []
@@ -75,20 +109,158 @@ class VideoMetadataFetcher:
             Optional[Dict]: Dictionary with video details, or None if failed
         """
         self.logger.debug(f"Fetching full metadata for video ID: {video_id}...")
-        ydl_opts = {"quiet": True, "skip_download": True}
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
-                result = self._parse_video_info(info)
-                # Log success with video_id if we got valid results
-                if result:
-                    self.logger.info("[%s] Video is valid. Adding to database and publishing to download queue.", video_id)
-                else:
-                    self.logger.info("[%s] Video is invalid. Skipping.", video_id)
-                return result
+            info = self._details_ydl.get().extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+            result = self._parse_video_info(info)
+            # Log success with video_id if we got valid results
+            if result:
+                self.logger.info("[%s] Video is valid. Adding to database and publishing to download queue.", video_id)
+            else:
+                self.logger.info("[%s] Video is invalid. Skipping.", video_id)
+            return result
         except Exception as e:
             self.logger.warning(f"Failed to fetch metadata for video ID {video_id}: {e}")
             # Still log that it's invalid when fetching fails
             self.logger.info("[%s] Video is invalid. Skipping.", video_id)
             return None
- 
+
+    def _get_player_api_session(self):
+        """Returns the shared HTTP session for player API requests, creating it on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=YOUTUBE_PLAYER_API_LIMIT_PER_HOST),
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    async def _fetch_player_response(self, video_id: str) -> Optional[Dict]:
+        """
+        Requests the player response of a video from the YouTube player API.
+        All requests pause for the Retry-After period once YouTube rate limits one of them.
+        Returns None if the request was not successful.
+        """
+        loop = asyncio.get_running_loop()
+        delay = self._player_api_resume_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        payload = {
+            "context": {"client": {"clientName": YOUTUBE_PLAYER_API_CLIENT_NAME, "clientVersion": YOUTUBE_PLAYER_API_CLIENT_VERSION}},
+            "videoId": video_id,
+        }
+        # prettyPrint=false drops the indentation YouTube adds by default, a good part of the response size
+        async with self._get_player_api_session().post(YOUTUBE_PLAYER_API_URL, params={"prettyPrint": "false"}, json=payload) as response:
+            if response.status == 429:
+                retry_after = response.headers.get("Retry-After", "")
+                delay = int(retry_after) if retry_after.isdigit() else YOUTUBE_PLAYER_API_DEFAULT_RETRY_AFTER
+                self._player_api_resume_at = max(self._player_api_resume_at, loop.time() + delay)
+                self.logger.warning(f"[{video_id}] Rate limited by the YouTube player API. Pausing requests for {delay} seconds.")
+                return None
+            if response.status != 200:
+                self.logger.debug(f"[{video_id}] YouTube player API returned status {response.status}.")
+                return None
+            return await response.json()
+
+    def _parse_player_response(self, player_response: Dict, video_id: str) -> Optional[Dict]:
+        """
+        Parses a YouTube player API response into the same format as _parse_video_info.
+        Returns None if the response lacks any of the needed fields.
+        """
+        video_details = player_response.get("videoDetails") or {}
+        microformat = player_response.get("microformat", {}).get("playerMicroformatRenderer", {})
+        length_seconds = video_details.get("lengthSeconds")
+        upload_date = microformat.get("uploadDate", "")
+        if video_details.get("videoId") != video_id or not length_seconds or len(upload_date) < 10:
+            return None
+
+        caption_tracks = player_response.get("captions", {}).get("playerCaptionsTracklistRenderer", {}).get("captionTracks", [])
+        # yt-dlp offers English auto-captions for any translatable auto-generated track, so those count too
+        has_captions = any(
+            track.get("languageCode") == "en" or (track.get("kind") == "asr" and track.get("isTranslatable"))
+            for track in caption_tracks
+        )
+
+        return {
+            "video_url": f"https://www.youtube.com/watch?v={video_id}", "video_id": video_id,
+            "video_title": video_details.get("title", "Unknown Title"), "duration": int(length_seconds),
+            "upload_date": f"{upload_date[8:10]}_{upload_date[5:7]}_{upload_date[0:4]}", "has_captions": has_captions
+        }
+
+    @classmethod
+    def _get_cached_video_details(cls, video_id: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Returns whether the details of a video are cached and not expired, and a copy of them.
+        A failed fetch is cached as None.
+        """
+        cached_entry = cls._video_details_cache.get(video_id)
+        if cached_entry is None:
+            return False, None
+        expires_at, video_details = cached_entry
+        if time.monotonic() > expires_at:
+            del cls._video_details_cache[video_id]
+            return False, None
+        cls._video_details_cache.move_to_end(video_id)
+        return True, dict(video_details) if video_details is not None else None
+
+    @classmethod
+    def _cache_video_details(cls, video_id: str, video_details: Optional[Dict]):
+        """
+        Caches a copy of the details of a video, evicting the least recently used entry when full.
+        Failed fetches are cached for a shorter time, so a video that keeps failing is not requested
+        again by every job, but a temporary failure does not hide the video for long.
+        """
+        if video_details:
+            cached_entry = (time.monotonic() + VIDEO_DETAILS_CACHE_TTL, dict(video_details))
+        else:
+            cached_entry = (time.monotonic() + VIDEO_DETAILS_FAILURE_CACHE_TTL, None)
+        cls._video_details_cache[video_id] = cached_entry
+        cls._video_details_cache.move_to_end(video_id)
+        if len(cls._video_details_cache) > VIDEO_DETAILS_CACHE_SIZE:
+            cls._video_details_cache.popitem(last=False)
+
+    async def fetch_video_details_async(self, video_id: str, executor: Optional[Executor] = None) -> Optional[Dict]:
+        """
+        Fetches the full metadata for a single video without blocking the event loop.
+
+        Videos that never enter the database, e.g. because they are too long, are listed and fetched
+        again by every discovery job, so fetched details are cached in-process for VIDEO_DETAILS_CACHE_TTL,
+        and failed fetches for VIDEO_DETAILS_FAILURE_CACHE_TTL. Callers get a copy they are free to modify.
+        """
+        is_cached, video_details = self._get_cached_video_details(video_id)
+        if is_cached:
+            self.logger.debug(f"[{video_id}] Using cached video details.")
+            return video_details
+
+        video_details = await self._fetch_video_details_uncached(video_id, executor)
+        self._cache_video_details(video_id, video_details)
+        return video_details
+
+    async def _fetch_video_details_uncached(self, video_id: str, executor: Optional[Executor] = None) -> Optional[Dict]:
+        """
+        Fetches the full metadata for a single video from YouTube.
+
+        The YouTube player API returns every needed field in one JSON request, without running
+        yt-dlp's extractor chain. yt-dlp on a worker thread is the fallback when aiohttp is not
+        installed or the player response cannot be used. It runs on the given executor, or the
+        event loop's default executor when none is given.
+        """
+        if aiohttp is not None:
+            try:
+                player_response = await self._fetch_player_response(video_id)
+                result = self._parse_player_response(player_response, video_id) if player_response else None
+            except Exception as e:
+                self.logger.debug(f"[{video_id}] YouTube player API request failed: {e}")
+                result = None
+
+            if result:
+                self.logger.info("[%s] Video is valid. Adding to database and publishing to download queue.", video_id)
+                return result
+            self.logger.debug(f"[{video_id}] Falling back to yt-dlp for video details.")
+
+        return await asyncio.get_running_loop().run_in_executor(executor, self.fetch_video_details, video_id)
+
+    async def aclose(self):
+        """Closes the shared player API session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -3,24 +3,74 @@ Encapsulates the entire processing pipeline for a single YouTube video.
 """
 import asyncio
 import os
+from contextlib import nullcontext
 from pathlib import Path
 import logging
 from concurrent.futures import ThreadPoolExecutor
-import aiofiles
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 from src.pipeline.VideoDownloader import VideoDownloader
 from src.pipeline.AudioTranscriber import AudioTranscriber
 from src.pipeline.AudioExtractor import AudioExtractor
 from src.utils.file_manager import FileManager
+from src.utils.vtt_parser import VttParser
+from src.constants.service_constants import MIN_VALID_TRANSCRIPTION_BYTES
+
+
+async def _read_text(path: Path, executor: Optional[ThreadPoolExecutor] = None) -> str:
+    """Reads a whole text file in a single worker thread hop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(Path(path).read_text, encoding="utf-8"))
+
+
+def _write_text_atomically(path: Path, text: str):
+    """
+    Writes a text file through a temporary '.part' file that only replaces path once complete,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+    path = Path(path)
+    partial_path = path.with_name(f"{path.name}.part")
+    try:
+        partial_path.write_text(text, encoding="utf-8")
+        os.replace(partial_path, path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+
+async def _write_text(path: Path, text: str, executor: Optional[ThreadPoolExecutor] = None):
+    """Writes a whole text file in a single worker thread hop."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, _write_text_atomically, path, text)
+
+
+def _is_nonempty_file(path: Path) -> bool:
+    """Checks that a file exists and is not empty with a single stat call. Empty files are left by failed steps."""
+    try:
+        return path.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
 
 class VideoProcessor:
     """
     Orchestrates the processing of a single video asynchronously.
     """
+    # Transcriptions being obtained right now by video_id, shared by all processors in the process,
+    # so concurrent pipelines for the same video wait for one transcription instead of each running their own
+    _transcriptions_in_progress: Dict[str, asyncio.Task] = {}
+
     def __init__(self, video_data: dict, services: dict, logger: logging.Logger, executor: ThreadPoolExecutor):
         self.video_data = video_data
         self.services = services
         self.logger = logger
         self.executor = executor
+        # Small file reads, writes and deletes get their own threads, so they never wait behind
+        # the long downloads and extractions on self.executor
+        self.fs_executor: Optional[ThreadPoolExecutor] = self.services.get('fs_executor')
+        # Caps the downloads running across all videos, so later videos download while earlier ones
+        # extract and transcribe, without the downloads taking every slot of self.executor
+        self.download_semaphore = self.services.get('download_semaphore') or nullcontext()
 
         self.video_id = self.video_data["video_id"]
         self.log_prefix = f"[{self.video_id}]"
@@ -36,81 +86,127 @@ class VideoProcessor:
         self.audio_path = self.video_paths["audio"]
         self.transcription_path = self.video_paths["transcription"]
         self.summary_path = self.video_paths["summary"]
+        # Stat the transcription once for the lifetime of the processor
+        self._has_transcription_file = self._is_transcription_file_valid()
+        # Transcription writes still running in the background, see wait_for_pending_writes
+        self._pending_writes: List[asyncio.Task] = []
+        # The background write started by this processor's own transcription, if any
+        self._transcription_write: Optional[asyncio.Task] = None
+        # The event loop running process(), set when processing starts
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def process(self) -> str | None:
         """Main entry point to start the processing of the video."""
-        self.logger.info(f"{self.log_prefix} --- Starting processing ---")
+        self.logger.info("%s --- Starting processing ---", self.log_prefix)
+        # Looked up once here, the pipeline steps below all run on this loop
+        self._loop = asyncio.get_running_loop()
         
         transcription_text = await self._get_transcription()
         if not transcription_text:
             self.logger.warning(f"{self.log_prefix} Could not obtain transcription. Halting processing for this video.")
             return None
         
-        self.logger.info(f"{self.log_prefix} --- Finished processing ---")
+        self.logger.info("%s --- Finished processing ---", self.log_prefix)
         return transcription_text
 
+    def _is_transcription_file_valid(self) -> bool:
+        """
+        Checks whether a usable transcription file exists. A file smaller than MIN_VALID_TRANSCRIPTION_BYTES
+        is left over from a crashed write, so it is treated as missing and the transcription is made again.
+        """
+        try:
+            return self.transcription_path.stat().st_size >= MIN_VALID_TRANSCRIPTION_BYTES
+        except FileNotFoundError:
+            return False
+
+    def _save_transcription_in_background(self, text: str):
+        """Starts writing the transcription to disk without waiting for it, so the text can be used right away."""
+        self._transcription_write = asyncio.create_task(_write_text(self.transcription_path, text, self.fs_executor))
+
+    async def wait_for_pending_writes(self):
+        """Waits until the transcriptions being written in the background are on disk."""
+        pending_writes, self._pending_writes = self._pending_writes, []
+        await asyncio.gather(*pending_writes)
+
     async def _get_transcription(self) -> str | None:
         """
-        Retrieves the transcription for the video, prioritizing existing files and captions.
+        Retrieves the transcription for the video, joining one already in progress for the same video.
         """
-        self.logger.info(f"{self.log_prefix} Step 3.2: Checking for transcription...")
-        if self.transcription_path.exists():
-            self.logger.info(f"{self.log_prefix} Local transcription file found. Reading from disk.")
-            async with aiofiles.open(self.transcription_path, "r", encoding="utf-8") as f:
-                return await f.read()
+        task = self._transcriptions_in_progress.get(self.video_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_or_create_shared_transcription())
+            self._transcriptions_in_progress[self.video_id] = task
+            task.add_done_callback(lambda _: self._transcriptions_in_progress.pop(self.video_id, None))
+        # Shielded, so a cancelled pipeline does not cancel the transcription the others are waiting for
+        transcription, transcription_write = await asyncio.shield(task)
+        if transcription_write is not None:
+            # Every pipeline sharing the transcription waits for it to reach the disk, not only the one that wrote it
+            self._pending_writes.append(transcription_write)
+        return transcription
+
+    async def _load_or_create_shared_transcription(self) -> Tuple[Optional[str], Optional[asyncio.Task]]:
+        """
+        Obtains the transcription together with the task writing it to disk, if one was started,
+        so the processors joining this transcription can wait for the write as well.
+        """
+        transcription = await self._load_or_create_transcription()
+        return transcription, self._transcription_write
+
+    async def _load_or_create_transcription(self) -> str | None:
+        """
+        Obtains the transcription for the video, prioritizing existing files and captions.
+        """
+        self.logger.info("%s Step 3.2: Checking for transcription...", self.log_prefix)
+        if self._has_transcription_file:
+            self.logger.info("%s Local transcription file found. Reading from disk.", self.log_prefix)
+            return await _read_text(self.transcription_path, self.fs_executor)
 
         if self.has_captions:
-            self.logger.info(f"{self.log_prefix} Video has captions. Attempting caption-based transcription.")
+            self.logger.info("%s Video has captions. Attempting caption-based transcription.", self.log_prefix)
             transcription = await self._download_and_process_captions()
             if transcription:
-                self.logger.info(f"{self.log_prefix} Caption-based transcription successful.")
+                self.logger.info("%s Caption-based transcription successful.", self.log_prefix)
                 return transcription
             self.logger.warning(f"{self.log_prefix} Caption download or processing failed. Falling back to manual transcription.")
         else:
-            self.logger.info(f"{self.log_prefix} Video has no captions. Proceeding with manual transcription.")
+            self.logger.info("%s Video has no captions. Proceeding with manual transcription.", self.log_prefix)
 
         return await self._transcribe_video_manually()
 
     async def _download_and_process_captions(self) -> str | None:
         """Downloads, processes, and cleans captions for the video."""
-        self.logger.info(f"{self.log_prefix} Step 3.3: Downloading captions.")
+        self.logger.info("%s Step 3.3: Downloading captions.", self.log_prefix)
         video_downloader: VideoDownloader = self.services['video_downloader']
         file_manager: FileManager = self.services['file_manager']
         
-        loop = asyncio.get_running_loop()
-        raw_caption_path = await loop.run_in_executor(
-            self.executor, video_downloader.download_captions, self.video_id, file_manager.paths['transcriptions']
-        )
+        async with self.download_semaphore:
+            raw_caption_path = await self._loop.run_in_executor(
+                self.executor, video_downloader.download_captions, self.video_id, file_manager.paths['transcriptions']
+            )
         
         if raw_caption_path and raw_caption_path.exists():
             try:
-                self.logger.info(f"{self.log_prefix} VTT file downloaded. Processing...")
+                self.logger.info("%s VTT file downloaded. Processing...", self.log_prefix)
                 text = await self._process_vtt_file(raw_caption_path)
                 
-                async with aiofiles.open(self.transcription_path, "w", encoding="utf-8") as f:
-                    await f.write(text)
-                self.logger.info(f"{self.log_prefix} Cleaned transcription saved to file.")
+                self._save_transcription_in_background(text)
+                self.logger.info("%s Saving cleaned transcription to file.", self.log_prefix)
                 
                 return text
             finally:
-                await loop.run_in_executor(self.executor, os.remove, raw_caption_path)
-                self.logger.info(f"{self.log_prefix} Deleted raw VTT file.")
+                await self._loop.run_in_executor(self.fs_executor, os.remove, raw_caption_path)
+                self.logger.info("%s Deleted raw VTT file.", self.log_prefix)
         
         return None
 
     async def _process_vtt_file(self, vtt_path: Path) -> str:
         """Cleans a VTT subtitle file, returning only the spoken text."""
-        async with aiofiles.open(vtt_path, "r", encoding="utf-8") as f:
-            lines = (await f.read()).splitlines()
-        cleaned_lines = [
-            line.strip() for line in lines 
-            if "-->" not in line and not line.startswith(("WEBVTT", "Kind:", "Language:")) and line.strip()
-        ]
-        return " ".join(cleaned_lines)
+        # One worker thread hop for the whole read, instead of one each for aiofiles' open, read and close
+        return await self._loop.run_in_executor(self.fs_executor, VttParser.to_plain_text, vtt_path)
 
     async def _transcribe_video_manually(self) -> str | None:
         """Manages the full audio transcription pipeline: download -> extract -> transcribe."""
-        self.logger.info(f"{self.log_prefix} Step 3.4: Starting manual transcription pipeline.")
+        self.logger.info("%s Step 3.4: Starting manual transcription pipeline.", self.log_prefix)
         
         if not await self._download_video():
             self.logger.error(f"{self.log_prefix} Video download failed. Cannot transcribe.")
@@ -124,40 +220,40 @@ class VideoProcessor:
 
     async def _download_video(self) -> bool:
         """Downloads the video if it doesn't already exist."""
-        if not self.video_path.exists():
-            self.logger.info(f"{self.log_prefix} Step 3.4a: Video file not found. Downloading...")
-            video_downloader: VideoDownloader = self.services['video_downloader']
-            file_manager: FileManager = self.services['file_manager']
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
+        if _is_nonempty_file(self.video_path):
+            self.logger.info("%s Step 3.4a: Video file already exists. Skipping download.", self.log_prefix)
+            return True
+
+        self.logger.info("%s Step 3.4a: Video file not found. Downloading...", self.log_prefix)
+        video_downloader: VideoDownloader = self.services['video_downloader']
+        file_manager: FileManager = self.services['file_manager']
+        async with self.download_semaphore:
+            await self._loop.run_in_executor(
                 self.executor, video_downloader.download_video, self.video_url, self.video_title, self.upload_date, self.video_id, file_manager.paths['videos']
             )
-        else:
-            self.logger.info(f"{self.log_prefix} Step 3.4a: Video file already exists. Skipping download.")
-        return self.video_path.exists()
+        return _is_nonempty_file(self.video_path)
 
     async def _extract_audio(self) -> bool:
         """Extracts audio from the video if it doesn't already exist."""
-        if not self.audio_path.exists():
-            self.logger.info(f"{self.log_prefix} Step 3.4b: Audio file not found. Extracting from video...")
-            audio_extractor: AudioExtractor = self.services['audio_extractor']
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                self.executor, audio_extractor.extract_audio, self.video_path, self.audio_path
-            )
-        else:
-            self.logger.info(f"{self.log_prefix} Step 3.4b: Audio file already exists. Skipping extraction.")
-        return self.audio_path.exists()
+        if _is_nonempty_file(self.audio_path):
+            self.logger.info("%s Step 3.4b: Audio file already exists. Skipping extraction.", self.log_prefix)
+            return True
+
+        self.logger.info("%s Step 3.4b: Audio file not found. Extracting from video...", self.log_prefix)
+        audio_extractor: AudioExtractor = self.services['audio_extractor']
+        await self._loop.run_in_executor(
+            self.executor, audio_extractor.extract_audio, self.video_path, self.audio_path
+        )
+        return _is_nonempty_file(self.audio_path)
 
     async def _transcribe_audio(self) -> str | None:
         """Transcribes the audio file."""
-        self.logger.info(f"{self.log_prefix} Step 3.4c: Transcribing audio file.")
+        self.logger.info("%s Step 3.4c: Transcribing audio file.", self.log_prefix)
         audio_transcriber: AudioTranscriber = self.services['audio_transcriber']
         # The transcribe_audio method is now async, so we can call it directly
-        # Pass video_id to create unique chunk filenames and avoid race conditions
+        # Pass video_id so the transcription is logged against this video
         transcription = await audio_transcriber.transcribe_audio(self.audio_path, video_id=self.video_id)
         if transcription:
-            self.logger.info(f"{self.log_prefix} Transcription successful. Saving to file.")
-            async with aiofiles.open(self.transcription_path, "w", encoding="utf-8") as f:
-                await f.write(transcription)
+            self.logger.info("%s Transcription successful. Saving to file.", self.log_prefix)
+            self._save_transcription_in_background(transcription)
         return transcription
\ No newline at end of file
@@ -7,6 +7,18 @@ from kafka.errors import KafkaError
 import time
 from src.utils.logger import setup_logging
 from src.constants.connection_constants import DEFAULT_KAFKA_BOOTSTRAP_SERVERS
+from src.constants.time_constants import (
+    KAFKA_API_VERSION_AUTO_TIMEOUT_MS,
+    KAFKA_CONSUMER_MAX_RETRY_DELAY,
+    KAFKA_CONSUMER_RETRY_DELAY
+)
+from src.utils.resilience import backoff_with_jitter
+
+try:
+    # Optional: without it, events are parsed with the standard library json module
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class AnalyticsService:
@@ -25,6 +37,7 @@ class AnalyticsService:
         """
         Main function to set up and start the Kafka consumer.
         """
+        attempt = 0
         while self.consumer is None:
             try:
                 self.consumer = KafkaConsumer(
@@ -33,12 +46,16 @@ class AnalyticsService:
                     auto_offset_reset='earliest',
                     enable_auto_commit=True,
                     group_id='analytics-group',
-                    value_deserializer=lambda x: json.loads(x.decode('utf-8'))
+                    # Both parsers take the raw bytes directly, so no separate decode is needed
+                    value_deserializer=orjson.loads if orjson else json.loads,
+                    api_version_auto_timeout_ms=KAFKA_API_VERSION_AUTO_TIMEOUT_MS
                 )
                 self.logger.info(f"Analytics service connected to Kafka and subscribed to topics: {self.topics}")
             except KafkaError as e:
-                self.logger.error(f"Failed to connect Kafka consumer: {e}. Retrying in 5 seconds...")
-                time.sleep(5)
+                delay = backoff_with_jitter(attempt, KAFKA_CONSUMER_RETRY_DELAY, KAFKA_CONSUMER_MAX_RETRY_DELAY)
+                attempt += 1
+                self.logger.error(f"Failed to connect Kafka consumer: {e}. Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
 
         try:
             for message in self.consumer:
@@ -1,12 +1,12 @@
 """
 Discovery Service - Discovers new videos from a YouTube channel using the service framework.
 """
-import datetime
 from typing import Optional
 from src.pipeline.VideoMetadataFetcher import VideoMetadataFetcher
 from src.pipeline.VideoDiscoverer import VideoDiscoverer
 from src.patterns.ServiceTemplatePattern import ServiceTemplate
 from src.enums.service_enums import ServiceType
+from src.utils.event_manager import utc_now_iso
 
 
 class DiscoveryService(ServiceTemplate[dict]):
@@ -40,29 +40,27 @@ class DiscoveryService(ServiceTemplate[dict]):
         video_discoverer = VideoDiscoverer(self.logger, metadata_fetcher, self.db_manager)
 
         # Discover videos that match our criteria
-        discovered_videos = video_discoverer.discover_videos(
-            channel_name, job_id, num_videos_to_process, 
-            max_video_length, apply_max_length_for_captionless_only
-        )
+        try:
+            discovered_videos = await video_discoverer.discover_videos(
+                channel_name, job_id, num_videos_to_process,
+                max_video_length, apply_max_length_for_captionless_only
+            )
+        finally:
+            await metadata_fetcher.aclose()
 
-        # Process discovered videos - create records and send to next service
-        processed_count = 0
-        for video_details in discovered_videos:
-            discovered_video_id = video_details['video_id']
+        # Create all the video records in one transaction
+        created_video_ids = set(self.db_manager.create_video_records(job_id, channel_name, discovered_videos))
 
-            # Create video record in database
-            if not self.db_manager.create_video_record(
-                discovered_video_id, job_id, channel_name,
-                video_details["video_title"], video_details["upload_date"],
-                video_details.get("duration"), video_details.get("has_captions", False)
-            ):
-                continue  # Skip if creation failed
-
-            # Send message to next service in the pipeline
-            if not self.queue_manager.send_message(ServiceType.DOWNLOAD, {"video_id": discovered_video_id, "has_captions": video_details.get("has_captions", False)}, discovered_video_id):
-                continue  # Skip if sending message failed
-
-            processed_count += 1
+        # Send the created videos to the next service in the pipeline in one batch
+        download_messages = [
+            {"video_id": video_details['video_id'], "has_captions": video_details.get("has_captions", False)}
+            for video_details in discovered_videos
+            if video_details['video_id'] in created_video_ids
+        ]
+        processed_count = self.queue_manager.send_messages(ServiceType.DOWNLOAD, download_messages)
+        if processed_count < len(download_messages):
+            self.logger.error("[Job: %s] Only %d of %d videos were sent to the %s queue",
+                              job_id, processed_count, len(download_messages), ServiceType.DOWNLOAD.name)
 
         return {
             "success": True, 
@@ -77,7 +75,7 @@ class DiscoveryService(ServiceTemplate[dict]):
         return {
             "job_id": data.get("job_id"),
             "channel_name": data.get("channel_name"),
-            "discovered_at": datetime.datetime.utcnow().isoformat(),
+            "discovered_at": utc_now_iso(),
             "videos_found": result.get("videos_found", 0) if result else 0
         }
 
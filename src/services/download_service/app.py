@@ -48,6 +48,11 @@ class DownloadService(ServiceTemplate[str]):
 
         return str(result) if result else None
 
+    async def _cleanup(self):
+        """Clean up worker resources and the download threads."""
+        await super()._cleanup()
+        self.data_downloader.shutdown(wait=False)
+
     def get_service_specific_event_fields(self, video_id: str, video, result: str) -> dict:
         return {
             "file_path": result
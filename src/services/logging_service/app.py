@@ -3,8 +3,18 @@ Logging Service - Consumes events from the event exchange and logs them.
 """
 import json
 from src.utils.logger import setup_logging
-from src.constants.service_constants import EVENTS_EXCHANGE_NAME
+from src.constants.service_constants import EVENTS_EXCHANGE_NAME, EVENT_ACK_BATCH_SIZE
 from src.constants.connection_constants import DEFAULT_RABBITMQ_HOST
+from src.constants.time_constants import EVENT_ACK_FLUSH_INTERVAL
+
+try:
+    # Optional: without it, events are parsed and logged with the standard library json module
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both parsers take the raw message bytes, and orjson's decode error subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson else json.loads
 
 
 class LoggingService:
@@ -13,24 +23,50 @@ class LoggingService:
         self.host = DEFAULT_RABBITMQ_HOST
         self.exchange_name = EVENTS_EXCHANGE_NAME
         self.queue_name = 'logging_service'
+        # Events are acknowledged in batches, with one multiple=True ack for the last delivery tag
+        self._last_unacked_tag = None
+        self._unacked_count = 0
+        self._ack_timer = None
 
     def event_callback(self, channel, method, properties, body):
         """
         Callback function to process received events.
         """
         try:
-            message = json.loads(body)
+            message = _loads(body)
             event_type = message.get("event_type", "UnknownEvent")
             payload = message.get("payload", {})
 
-            self.logger.info("EVENT RECEIVED [%s]: %s", event_type, json.dumps(payload))
+            self.logger.info("EVENT RECEIVED [%s]: %s", event_type, orjson.dumps(payload).decode() if orjson else json.dumps(payload))
 
         except json.JSONDecodeError:
             self.logger.error("Failed to decode event message: %s", body)
         except Exception as e:
             self.logger.error("An error occurred processing event: %s", e)
         finally:
-            channel.basic_ack(delivery_tag=method.delivery_tag)
+            self._ack_in_batch(channel, method.delivery_tag)
+
+    def _ack_in_batch(self, channel, delivery_tag):
+        """
+        Acknowledges events in batches of EVENT_ACK_BATCH_SIZE, instead of a broker round-trip per event.
+        A partial batch is acknowledged after EVENT_ACK_FLUSH_INTERVAL, so quiet periods do not hold it back.
+        """
+        self._last_unacked_tag = delivery_tag
+        self._unacked_count += 1
+        if self._unacked_count >= EVENT_ACK_BATCH_SIZE:
+            self._flush_acks(channel)
+        elif self._ack_timer is None:
+            self._ack_timer = channel.connection.call_later(EVENT_ACK_FLUSH_INTERVAL, lambda: self._flush_acks(channel))
+
+    def _flush_acks(self, channel):
+        """Acknowledges every event received so far on the channel with a single ack."""
+        if self._ack_timer is not None:
+            channel.connection.remove_timeout(self._ack_timer)
+            self._ack_timer = None
+        if self._last_unacked_tag is not None:
+            channel.basic_ack(delivery_tag=self._last_unacked_tag, multiple=True)
+        self._last_unacked_tag = None
+        self._unacked_count = 0
 
     def run(self):
         """
@@ -42,6 +78,10 @@ class LoggingService:
         while True:
             try:
                 connection = pika.BlockingConnection(pika.ConnectionParameters(host=self.host))
+                # Unacknowledged events of a lost connection are redelivered on the new one
+                self._last_unacked_tag = None
+                self._unacked_count = 0
+                self._ack_timer = None
                 channel = connection.channel()
 
                 # Declare the fanout exchange (should match the publisher)
@@ -55,7 +95,8 @@ class LoggingService:
 
                 self.logger.info("Logging service is waiting for events. To exit press CTRL+C")
 
-                channel.basic_qos(prefetch_count=1)
+                # Let a whole batch of events arrive before the first ack is sent
+                channel.basic_qos(prefetch_count=EVENT_ACK_BATCH_SIZE)
                 channel.basic_consume(queue=self.queue_name, on_message_callback=self.event_callback)
                 channel.start_consuming()
 
@@ -54,6 +54,11 @@ class SummarizationService(ServiceTemplate[str]):
 
         return summary_text
 
+    async def _cleanup(self):
+        """Clean up worker resources and close the OpenAI client."""
+        await super()._cleanup()
+        await self.summarizer_agent.aclose()
+
     def get_service_specific_event_fields(self, video_id: str, video, result: str) -> dict:
         return {
             "summary_length": len(result) if result else 0
@@ -22,6 +22,11 @@ class TranscriptionService(ServiceTemplate[str]):
         audio_path = input_file_path
         transcription_path = video_paths["transcription"]
 
+        # Captioned videos already have their transcription from the captions, so skip speech-to-text
+        if getattr(video, 'has_captions', False) and transcription_path.exists():
+            self.logger.info("[%s] Transcription from captions already exists. Skipping audio transcription.", video_id)
+            return str(transcription_path)
+
         # Transcribe and save the audio using the pipeline tool (automatically logs status)
         result_path = await self.audio_transcriber.transcribe_audio_and_save(
             audio_path, transcription_path, video_id=video_id
@@ -29,6 +34,11 @@ class TranscriptionService(ServiceTemplate[str]):
 
         return str(result_path) if result_path else None
 
+    async def _cleanup(self):
+        """Clean up worker resources and the shared transcription executor."""
+        await super()._cleanup()
+        AudioTranscriber.shutdown_executor(wait=False)
+
     def get_service_specific_event_fields(self, video_id: str, video, result: str) -> dict:
         return {
             "character_count": len(result) if result else 0
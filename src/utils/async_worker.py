@@ -2,32 +2,63 @@
 Async worker for RabbitMQ consumption that bridges threading and asyncio.
 """
 import asyncio
+import concurrent.futures
 import json
+import os
 import threading
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 from src.utils.logger import setup_logging
 from src.utils.queue_client import QueueClient
+from src.constants.connection_constants import DEFAULT_RABBITMQ_HOST
+from src.constants.service_constants import WORKER_MAX_CONCURRENT_MESSAGES, WORKER_CONCURRENCY_ENV
+from src.constants.time_constants import RABBITMQ_HEARTBEAT_INTERVAL, RABBITMQ_RETRY_DELAY
+
+try:
+    # Optional: without it, messages are consumed by pika on a separate thread
+    import aio_pika
+except ImportError:
+    aio_pika = None
+
+
+def _get_worker_concurrency() -> int:
+    """Gets the number of messages a worker processes at the same time from the environment."""
+    try:
+        return max(1, int(os.getenv(WORKER_CONCURRENCY_ENV, WORKER_MAX_CONCURRENT_MESSAGES)))
+    except ValueError:
+        return WORKER_MAX_CONCURRENT_MESSAGES
 
 
 class AsyncWorker(ABC):
     """
     An async worker that consumes from RabbitMQ queues and processes messages
     using asyncio coroutines, while handling the threading complexity internally.
+
+    With aio-pika installed, the queue is consumed on the event loop itself. Otherwise a pika
+    consumer runs on a separate thread and hands each message over to the event loop.
+
+    At most WORKER_CONCURRENCY messages are processed at once. A message is only acknowledged
+    once it gets a processing slot, and as many again are prefetched to wait for one, so a
+    freed slot is filled without a broker round-trip while the broker holds back the rest.
     """
     def __init__(self, queue_name: str):
         self.queue_name = queue_name
         self.logger = setup_logging()
         self.loop = None
         self.queue_client = None
-        self._running = False
+        self._stopped = None
         self._tasks = set()
+        self.max_concurrent_messages = _get_worker_concurrency()
+        self._message_slots = None
 
     async def initialize(self):
         """Initialize the worker components."""
-        self.queue_client = QueueClient(logger=self.logger)
-        self.queue_client.declare_queue(self.queue_name)
-        self.loop = asyncio.get_event_loop()
+        if aio_pika is None:
+            self.queue_client = QueueClient(logger=self.logger)
+            self.queue_client.declare_queue(self.queue_name)
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._message_slots = asyncio.Semaphore(self.max_concurrent_messages)
 
     def run(self):
         """Run the worker synchronously (starts the consumer thread)."""
@@ -38,39 +69,139 @@ class AsyncWorker(ABC):
         await self.initialize()
         self.logger.info(f"Starting AsyncWorker for queue '{self.queue_name}'")
         
-        # Start the RabbitMQ consumer thread
-        consumer_thread = threading.Thread(target=self._start_consumer, daemon=True)
-        consumer_thread.start()
-        
         try:
-            self._running = True
-            # Keep the main thread alive to handle async tasks
-            while self._running:
-                await asyncio.sleep(1)
+            if aio_pika is not None:
+                await self._consume_async()
+            else:
+                # Start the RabbitMQ consumer thread
+                consumer_thread = threading.Thread(target=self._start_consumer, daemon=True)
+                consumer_thread.start()
+                # Keep the event loop running the message tasks until the consumer stops,
+                # without waking up periodically to check
+                await self._stopped.wait()
         except KeyboardInterrupt:
             self.logger.info("Shutting down worker...")
         finally:
             await self._cleanup()
 
+    async def _connect_async(self):
+        """Connects to RabbitMQ with aio-pika, retrying until the broker is reachable."""
+        while True:
+            try:
+                return await aio_pika.connect_robust(host=DEFAULT_RABBITMQ_HOST, heartbeat=RABBITMQ_HEARTBEAT_INTERVAL)
+            except Exception as e:
+                self.logger.error(f"Could not connect to RabbitMQ: {e}. Retrying in {RABBITMQ_RETRY_DELAY} seconds...")
+                await asyncio.sleep(RABBITMQ_RETRY_DELAY)
+
+    async def _consume_async(self):
+        """
+        Consume the queue with aio-pika until the worker stops. The robust connection
+        reconnects and resumes consuming by itself if the broker connection drops.
+        """
+        connection = await self._connect_async()
+        try:
+            channel = await connection.channel()
+            await channel.set_qos(prefetch_count=self.max_concurrent_messages)
+            queue = await channel.declare_queue(self.queue_name, durable=True)
+            await queue.consume(self._process_message_native)
+            self.logger.info(f"Waiting for messages on queue '{self.queue_name}'.")
+            await self._stopped.wait()
+        finally:
+            await connection.close()
+
+    async def _process_message_native(self, message):
+        """
+        aio-pika callback that schedules async processing, without a thread handoff.
+        """
+        try:
+            data = json.loads(message.body)
+        except ValueError as e:
+            # A malformed message can never be processed, so drop it instead of holding a prefetch slot
+            self.logger.error(f"Rejecting malformed message: {e}")
+            try:
+                await message.reject(requeue=False)
+            except Exception as reject_error:
+                self.logger.error(f"Error rejecting message: {reject_error}")
+            return
+
+        task = asyncio.create_task(self._process_message_in_slot(data, lambda: self._ack_native(message)))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    async def _ack_native(self, message) -> bool:
+        """Acknowledges an aio-pika message, returning whether it succeeded."""
+        try:
+            await message.ack()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error acknowledging message: {e}")
+            return False
+
+    async def _ack_threadsafe(self, channel, delivery_tag) -> bool:
+        """
+        Acknowledges a pika message on the consumer thread, which owns the channel,
+        and waits for the result there without blocking the event loop.
+        """
+        acked = self.loop.create_future()
+
+        def ack():
+            try:
+                channel.basic_ack(delivery_tag=delivery_tag)
+                result = True
+            except Exception as e:
+                self.logger.error(f"Error acknowledging message: {e}")
+                result = False
+            self.loop.call_soon_threadsafe(acked.set_result, result)
+
+        try:
+            channel.connection.add_callback_threadsafe(ack)
+        except Exception as e:
+            self.logger.error(f"Error acknowledging message: {e}")
+            return False
+        return await acked
+
+    async def _process_message_in_slot(self, data: Dict[str, Any], ack):
+        """
+        Waits for a free processing slot, then acknowledges and processes the message.
+        Acknowledging only now keeps waiting messages on the broker's side, so they are
+        redelivered if the worker stops, and long-running work is not cut off by the
+        broker's consumer timeout.
+        """
+        async with self._message_slots:
+            if not await ack():
+                return
+            await self._process_message_async(data)
+
     def _start_consumer(self):
         """Start the RabbitMQ consumer in a separate thread."""
-        self.queue_client.start_consuming(self.queue_name, self._process_message_sync)
+        try:
+            self.queue_client.start_consuming(self.queue_name, self._process_message_sync,
+                                              prefetch_count=self.max_concurrent_messages)
+        finally:
+            # No more messages will arrive, so let the worker shut down instead of idling
+            self.logger.warning(f"Consumer for queue '{self.queue_name}' stopped.")
+            self.loop.call_soon_threadsafe(self._stopped.set)
 
     def _process_message_sync(self, channel, method, properties, body):
         """
         Synchronous callback from RabbitMQ that schedules async processing.
         """
-        # Acknowledge immediately to avoid delivery tag conflicts
         try:
-            channel.basic_ack(delivery_tag=method.delivery_tag)
-        except Exception as e:
-            self.logger.error(f"Error acknowledging message: {e}")
+            data = json.loads(body)
+        except ValueError as e:
+            # A malformed message can never be processed. Raising here would stop the consumer and
+            # the message would be redelivered on restart, so drop it without requeueing instead.
+            self.logger.error(f"Rejecting malformed message: {e}")
+            try:
+                channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            except Exception as nack_error:
+                self.logger.error(f"Error rejecting message: {nack_error}")
             return
 
-        # Schedule the async processing in the event loop
-        data = json.loads(body)
+        # Schedule the async processing in the event loop. The ack is sent back on this
+        # thread once the message gets a slot, to avoid delivery tag conflicts.
         task = asyncio.run_coroutine_threadsafe(
-            self._process_message_async(data), self.loop
+            self._process_message_in_slot(data, lambda: self._ack_threadsafe(channel, method.delivery_tag)), self.loop
         )
         self._tasks.add(task)
         task.add_done_callback(self._on_task_done)
@@ -98,19 +229,22 @@ class AsyncWorker(ABC):
     def _on_task_done(self, task):
         """Callback when an async task completes."""
         self._tasks.discard(task)
-        if task.exception():
+        if not task.cancelled() and task.exception():
             self.logger.error(f"Async task failed: {task.exception()}")
 
     async def _cleanup(self):
         """Clean up resources."""
-        self._running = False
-        # Cancel all pending tasks
-        for task in self._tasks:
+        self._stopped.set()
+        # Cancel all pending tasks. Done callbacks remove tasks from the set, so iterate over a copy.
+        # Tasks scheduled from the consumer thread are concurrent futures, wrapped to be awaited here.
+        tasks = [asyncio.wrap_future(task) if isinstance(task, concurrent.futures.Future) else task
+                 for task in list(self._tasks)]
+        for task in tasks:
             if not task.done():
                 task.cancel()
         
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         if self.queue_client:
             self.queue_client.close_connection()
\ No newline at end of file
@@ -24,7 +24,7 @@ class BaseService(AsyncWorker, ABC):
         """Initialize the base service components."""
         await super().initialize()
 
-    async def cleanup(self):
+    async def _cleanup(self):
         """Clean up all service resources."""
         await super()._cleanup()
         self.queue_manager.close()
@@ -1,9 +1,15 @@
 """
 Database abstraction layer for consistent operations across services.
 """
-from typing import Optional
+import csv
+import io
+from typing import Dict, List, Optional, Set
 from src.utils.postgresql_client import postgres_client, Video
-from src.enums.service_enums import ProcessingStatus
+from src.enums.service_enums import ProcessingStatus, ServiceType
+from src.constants.connection_constants import VIDEO_RECORDS_COPY_THRESHOLD
+
+# Columns written by COPY, which bypasses the model's Python-side defaults, so every column is given
+VIDEO_COPY_COLUMNS = ("id", "job_id", "channel_name", "title", "upload_date", "duration", "has_captions", "stage", "status")
 
 
 class DatabaseManager:
@@ -31,27 +37,65 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def start_video_stage(self, video_id: str, stage, status):
+        """
+        Get a video record and mark it with the given stage and status, in a single transaction.
+        The previous service normally sets both when it hands the video over, so then only the
+        SELECT runs, without an UPDATE or a commit.
+        Returns the video record, or None if it was not found or could not be updated.
+        """
+        session = self.client.get_session()
+        # The returned record is read after the session closes, so keep its loaded attributes
+        session.expire_on_commit = False
+        try:
+            video = session.query(Video).filter_by(id=video_id).first()
+            if video is None:
+                self._log_db_error(video_id, "Video not found in database")
+                return None
+            if video.stage != stage or video.status != status:
+                video.stage = stage
+                video.status = status
+                session.commit()
+                self._log_db_info(video_id, f"Database fields updated: stage={stage}, status={status}")
+            return video
+        except Exception as e:
+            self._log_db_error(video_id, f"Error updating video record: {e}")
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+    def get_existing_video_ids(self, video_ids: List[str]) -> Set[str]:
+        """Get the subset of the given video IDs that already exist in the database, in a single query."""
+        if not video_ids:
+            return set()
+        session = self.client.get_session()
+        try:
+            rows = session.query(Video.id).filter(Video.id.in_(video_ids)).all()
+            return {row.id for row in rows}
+        finally:
+            session.close()
+
     def update_video(self, video_id: str, **fields) -> bool:
         """
         Update any fields of a video record in the database.
         Accepts any field name and value as keyword arguments.
         Returns True if successful, False otherwise.
         """
+        for field_name in fields:
+            if not hasattr(Video, field_name):
+                self._log_db_error(video_id, f"Video model has no attribute '{field_name}'")
+                return False
+
         session = self.client.get_session()
         try:
-            video = session.query(Video).filter_by(id=video_id).first()
-            if not video:
+            # A single UPDATE ... WHERE id = ? rather than loading the row first and then updating it
+            updated_rows = session.query(Video).filter_by(id=video_id).update(fields, synchronize_session=False)
+            if not updated_rows:
+                session.rollback()
                 self._log_db_error(video_id, "Video not found in database")
                 return False
 
-            # Update any provided fields
-            for field_name, field_value in fields.items():
-                if hasattr(video, field_name):
-                    setattr(video, field_name, field_value)
-                else:
-                    self._log_db_error(video_id, f"Video model has no attribute '{field_name}'")
-                    return False
-
             session.commit()
             field_updates = ", ".join([f"{k}={v}" for k, v in fields.items()])
             self._log_db_info(video_id, f"Database fields updated: {field_updates}")
@@ -100,11 +144,97 @@ class DatabaseManager:
             )
             session.add(new_video)
             session.commit()
-            self._log_db_info(video_id, f"Video record created in database with status PENDING, captions: {has_captions}")
+            self._log_db_info(video_id, f"Video record created in database with status {ProcessingStatus.PROCESSING.value}, captions: {has_captions}")
             return True
         except Exception as e:
             self._log_db_error(video_id, f"Error creating video record: {e}")
             session.rollback()
             return False
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    def _add_video_records(self, session, job_id: str, channel_name: str, videos_details: List[Dict]):
+        """Adds the records of discovered videos to the session, inserted on commit."""
+        session.add_all([
+            Video(
+                id=video_details["video_id"],
+                job_id=job_id,
+                channel_name=channel_name,
+                title=video_details["video_title"],
+                upload_date=video_details["upload_date"],
+                duration=video_details.get("duration"),
+                has_captions=video_details.get("has_captions", False),
+                status=ProcessingStatus.PROCESSING.value
+            )
+            for video_details in videos_details
+        ])
+
+    def _copy_video_records(self, session, job_id: str, channel_name: str, videos_details: List[Dict]):
+        """
+        Streams the records of discovered videos to PostgreSQL with COPY, in the session's transaction.
+        Rows are written as CSV with every field but the numbers quoted, so titles may hold any character.
+        The csv module writes a missing duration as "", which FORCE_NULL reads back as NULL.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        for video_details in videos_details:
+            writer.writerow((
+                video_details["video_id"], job_id, channel_name,
+                video_details["video_title"], video_details["upload_date"],
+                video_details.get("duration"), bool(video_details.get("has_captions", False)),
+                ServiceType.DISCOVERY.name, ProcessingStatus.PROCESSING.value
+            ))
+        buffer.seek(0)
+
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {Video.__tablename__} ({', '.join(VIDEO_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv, FORCE_NULL (duration))", buffer
+            )
+        finally:
+            cursor.close()
+
+    def create_video_records(self, job_id: str, channel_name: str, videos_details: List[Dict]) -> List[str]:
+        """
+        Create the records of many discovered videos in a single transaction.
+        If the batch fails, e.g. because one video was added meanwhile, each record is created on its own
+        so one bad record does not drop the rest.
+
+        Batches of VIDEO_RECORDS_COPY_THRESHOLD or more records, e.g. when a large channel is first
+        discovered, are streamed to PostgreSQL with a single COPY instead of an INSERT per row.
+
+        Returns:
+            List[str]: The IDs of the videos whose records were created.
+        """
+        if not videos_details:
+            return []
+        session = self.client.get_session()
+        try:
+            if len(videos_details) >= VIDEO_RECORDS_COPY_THRESHOLD and session.get_bind().dialect.driver == "psycopg2":
+                self._copy_video_records(session, job_id, channel_name, videos_details)
+            else:
+                self._add_video_records(session, job_id, channel_name, videos_details)
+            session.commit()
+            batch_error = None
+        except Exception as e:
+            session.rollback()
+            batch_error = e
+        finally:
+            session.close()
+
+        if batch_error is not None:
+            # Only once the batch session has returned its connection, so each record does not hold a second one
+            self.logger.warning("[Job: %s] Could not create %d video records together, creating them one by one: %s",
+                                job_id, len(videos_details), batch_error)
+            return [
+                video_details["video_id"] for video_details in videos_details
+                if self.create_video_record(
+                    video_details["video_id"], job_id, channel_name,
+                    video_details["video_title"], video_details["upload_date"],
+                    video_details.get("duration"), video_details.get("has_captions", False)
+                )
+            ]
+
+        for video_details in videos_details:
+            self._log_db_info(video_details["video_id"], f"Video record created in database with status {ProcessingStatus.PROCESSING.value}, captions: {video_details.get('has_captions', False)}")
+        return [video_details["video_id"] for video_details in videos_details]
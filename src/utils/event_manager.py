@@ -1,8 +1,29 @@
 """
 Event publishing abstraction layer for consistent operations across services.
 """
+import asyncio
 import datetime
-from typing import Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Tuple
+
+# The last (second, ISO string) formatted by utc_now_iso
+_utc_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Returns the current UTC time as an ISO string, to the second.
+    The string is formatted once per second and reused by the events published within it.
+    """
+    global _utc_iso_cache
+    now_seconds = int(time.time())
+    cached_seconds, cached_iso = _utc_iso_cache
+    if now_seconds != cached_seconds:
+        cached_iso = datetime.datetime.fromtimestamp(now_seconds, tz=datetime.timezone.utc).isoformat()
+        # Swapped as one tuple, so threads never see a second paired with another second's string
+        _utc_iso_cache = (now_seconds, cached_iso)
+    return cached_iso
 
 
 class EventManager:
@@ -16,6 +37,9 @@ class EventManager:
         from src.utils.kafka_producer import KafkaEventProducer
         self.rabbitmq_publisher = EventPublisher(logger=logger)
         self.kafka_producer = KafkaEventProducer(logger=logger)
+        # Events are informational, so services hand them to this single thread instead of waiting for the
+        # publish. One thread keeps the events in order and the RabbitMQ connection on a single thread.
+        self._publish_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="events")
 
     def build_event_payload(self, video_id: str, video, result, service_specific_fields: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -26,7 +50,7 @@ class EventManager:
         base_payload = {
             "video_id": video_id,
             "job_id": job_id,
-            "completed_at": datetime.datetime.utcnow().isoformat()
+            "completed_at": utc_now_iso()
         }
 
         # Add service-specific fields if provided
@@ -55,8 +79,8 @@ class EventManager:
     def _publish_event_to_kafka(self, event_type: str, event_payload: Dict[str, Any]) -> bool:
         """Publish an event to Kafka."""
         try:
-            self.kafka_producer.send_event(event_type, event_payload)
-            return True
+            # send_event reports a failed send by returning None instead of raising
+            return self.kafka_producer.send_event(event_type, event_payload) is not None
         except Exception as e:
             self.logger.error("Failed to publish event '%s' to Kafka: %s", event_type, e)
             return False
@@ -66,9 +90,12 @@ class EventManager:
         Publish an event to both RabbitMQ exchange and Kafka.
         Handles its own logging for success and failure.
         Returns True if at least one publishing succeeded, False otherwise.
+
+        The Kafka send only queues the event for the producer's I/O thread, so it goes first
+        and its network send overlaps the blocking RabbitMQ publish rather than following it.
         """
-        success_rabbitmq = self._publish_event_to_rabbitmq(event_type, event_payload)
         success_kafka = self._publish_event_to_kafka(event_type, event_payload)
+        success_rabbitmq = self._publish_event_to_rabbitmq(event_type, event_payload)
 
         # Return True if at least one succeeded
         result = success_rabbitmq or success_kafka
@@ -80,13 +107,23 @@ class EventManager:
 
         return result
 
+    def publish_event_in_background(self, event_type: str, event_payload: Dict[str, Any], video_id: str = None):
+        """
+        Queue an event to be published to both RabbitMQ exchange and Kafka, without waiting for it.
+        Events are published in the order they were queued, and close() waits for the queued ones.
+        """
+        self._publish_executor.submit(self.publish_event, event_type, event_payload, video_id)
+
     async def publish_completion_event_async(self, event_type: str, video_id: str, video, result, service_specific_fields: Dict[str, Any] = None):
-        """Async version to publish completion events."""
+        """Async version to publish completion events, published on the events thread without blocking the event loop."""
         event_payload = self.build_event_payload(video_id, video, result, service_specific_fields)
-        return self.publish_event(event_type, event_payload, video_id)
+        return await asyncio.wrap_future(self._publish_executor.submit(self.publish_event, event_type, event_payload, video_id))
 
     def close(self):
         """Close all event publishing connections."""
+        # Publish the events still queued before closing the connections they need
+        self._publish_executor.shutdown(wait=True)
+
         try:
             self.rabbitmq_publisher.close()
         except Exception as e:
@@ -6,11 +6,10 @@ the existence of files, particularly summaries. This centralizes file management
 logic and ensures consistency across the application.
 """
 import os
-import re
 from pathlib import Path
 from typing import Dict, Optional
+from src.utils.common_logger import sanitize_filename
 from src.constants.service_constants import (
-    MAX_FILENAME_LENGTH,
     VIDEO_FILE_EXTENSION,
     AUDIO_FILE_EXTENSION,
     TRANSCRIPTION_FILE_EXTENSION
@@ -52,14 +51,6 @@ class FileManager:
         
         return base_paths
 
-    @staticmethod
-    def _sanitize_filename(filename: str) -> str:
-        """Removes invalid characters from a string to make it a valid filename."""
-        sanitized = re.sub(r'[\\/:*?"<>|]', '', filename)
-        # Replace spaces with underscores as requested
-        sanitized = sanitized.replace(' ', '_')
-        return sanitized[:MAX_FILENAME_LENGTH]
-
     @staticmethod
     def get_base_filename(video_data: Dict) -> str:
         """
@@ -72,7 +63,7 @@ class FileManager:
         Returns:
             str: The standardized base filename without the extension.
         """
-        sanitized_title = FileManager._sanitize_filename(video_data["video_title"])
+        sanitized_title = sanitize_filename(video_data["video_title"])
         return f"{sanitized_title}-{video_data['upload_date']}-{video_data['video_id']}"
 
     def get_video_paths(self, video_data: Dict) -> Dict[str, Path]:
@@ -119,12 +110,14 @@ class FileManager:
             if file_type == "summary":
                 continue
 
-            if file_path.exists():
-                try:
-                    os.remove(file_path)
-                    self.logger.info(f"Deleted intermediate file: {file_path}")
-                except Exception as e:
-                    self.logger.error(f"Error deleting file {file_path}: {e}")
+            # Remove directly instead of checking existence first, saving a stat call per file
+            try:
+                os.remove(file_path)
+                self.logger.info(f"Deleted intermediate file: {file_path}")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.logger.error(f"Error deleting file {file_path}: {e}")
 
     def validate_input_file_path(self, file_path: Path, video_id: str) -> Optional[Path]:
         """Validate that the specified file path exists and return it as Path object."""
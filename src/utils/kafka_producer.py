@@ -9,9 +9,10 @@ from src.constants.time_constants import (
     KAFKA_MAX_BLOCK_MS,
     KAFKA_RECONNECT_BACKOFF_MAX_MS,
     KAFKA_SEND_TIMEOUT,
-    KAFKA_RECONNECT_BACKOFF_MS
+    KAFKA_RECONNECT_BACKOFF_MS,
+    KAFKA_LINGER_MS
 )
-from src.constants.connection_constants import DEFAULT_KAFKA_BOOTSTRAP_SERVERS
+from src.constants.connection_constants import DEFAULT_KAFKA_BOOTSTRAP_SERVERS, KAFKA_BATCH_SIZE, KAFKA_COMPRESSION_TYPE
 
 class KafkaEventProducer:
     def __init__(self, bootstrap_servers=DEFAULT_KAFKA_BOOTSTRAP_SERVERS, logger=None):
@@ -29,8 +30,11 @@ class KafkaEventProducer:
                     bootstrap_servers=self.bootstrap_servers,
                     value_serializer=lambda v: json.dumps(v).encode('utf-8'),
                     retries=3,
-                    acks='all',
-                    linger_ms=5,  # Small delay to batch messages together
+                    acks=1,  # Events are analytics data, the leader's ack is enough
+                    # Batch events sent close together into one compressed request
+                    linger_ms=KAFKA_LINGER_MS,
+                    batch_size=KAFKA_BATCH_SIZE,
+                    compression_type=KAFKA_COMPRESSION_TYPE,
                     request_timeout_ms=KAFKA_REQUEST_TIMEOUT_MS,  # 15 seconds timeout
                     max_block_ms=KAFKA_MAX_BLOCK_MS,  # Max time to block on send
                     reconnect_backoff_ms=KAFKA_RECONNECT_BACKOFF_MS,  # Initial backoff for reconnection
@@ -69,14 +73,21 @@ class KafkaEventProducer:
                         pass  # Ignore errors during close
                     self._connect()
 
+    def _on_send_success(self, record_metadata):
+        self.logger.info(f"Event sent to Kafka topic '{record_metadata.topic}'.")
+
+    def _on_send_error(self, error):
+        self.logger.error(f"Error delivering event to Kafka: {error}")
+
     def send_event(self, topic, event_data):
+        """
+        Queues an event for sending without waiting for Kafka to acknowledge it, so events are
+        batched by linger_ms. Delivery is logged from the producer's callbacks, and close() flushes
+        anything still queued.
+        """
         try:
             self._ensure_connection()
             future = self.producer.send(topic, event_data)
-            # Block for 'successful' sends
-            record_metadata = future.get(timeout=KAFKA_SEND_TIMEOUT)  # Increased timeout
-            self.logger.info(f"Event sent to Kafka topic '{record_metadata.topic}'.")
-            return record_metadata
         except Exception as e:
             self.logger.error(f"Error sending event to Kafka: {e}")
             # Try to reconnect and send once more
@@ -85,12 +96,12 @@ class KafkaEventProducer:
                     self.producer.close()
                     self._connect()
                 future = self.producer.send(topic, event_data)
-                record_metadata = future.get(timeout=KAFKA_SEND_TIMEOUT)
-                self.logger.info(f"Retried and sent event to Kafka topic '{record_metadata.topic}'.")
-                return record_metadata
             except Exception as retry_error:
                 self.logger.error(f"Retry also failed: {retry_error}")
                 return None
+        future.add_callback(self._on_send_success)
+        future.add_errback(self._on_send_error)
+        return future
 
     def close(self):
         if self.producer:
@@ -82,10 +82,37 @@ class QueueClient:
         except Exception as e:
             self.logger.error(f"Failed to publish message to queue '{queue_name}': {e}")
 
-    def start_consuming(self, queue_name, callback):
+    def publish_messages(self, queue_name, message_bodies):
+        """
+        Publishes many messages to a queue back to back, checking the connection once for the whole batch.
+        If the stream is lost partway, the connection is reopened and the unsent messages are published again once.
+        """
+        properties = pika.BasicProperties(delivery_mode=2)  # make messages persistent
+        sent_count = 0
+        try:
+            self._ensure_connection()
+            for message_body in message_bodies:
+                self.channel.basic_publish(exchange='', routing_key=queue_name, body=json.dumps(message_body), properties=properties)
+                sent_count += 1
+        except pika.exceptions.StreamLostError as e:
+            self.logger.error(f"Stream lost error during batch publishing after {sent_count} messages: {e}")
+            # Reconnect and try the rest once more
+            try:
+                self._connect()
+                for message_body in message_bodies[sent_count:]:
+                    self.channel.basic_publish(exchange='', routing_key=queue_name, body=json.dumps(message_body), properties=properties)
+                    sent_count += 1
+            except Exception as retry_error:
+                self.logger.error(f"Retry also failed: {retry_error}")
+        except Exception as e:
+            self.logger.error(f"Failed to publish messages to queue '{queue_name}': {e}")
+        self.logger.info(f"Sent {sent_count} of {len(message_bodies)} messages to queue '{queue_name}'.")
+        return sent_count
+
+    def start_consuming(self, queue_name, callback, prefetch_count=1):
         # Ensure connection is established
         self._ensure_connection()
-        self.channel.basic_qos(prefetch_count=1)
+        self.channel.basic_qos(prefetch_count=prefetch_count)
         self.channel.basic_consume(queue=queue_name, on_message_callback=callback)
         self.logger.info(f"Waiting for messages on queue '{queue_name}'. To exit press CTRL+C")
         try:
@@ -1,7 +1,7 @@
 """
 Message queue abstraction layer for consistent operations across services.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class QueueManager:
@@ -12,10 +12,15 @@ class QueueManager:
         self.logger = logger
         from src.utils.queue_client import QueueClient
         self.client = QueueClient(logger=logger)
+        # Queues are durable, so each one only needs declaring once per process rather than per message
+        self._declared_queues = set()
 
     def declare_queue(self, queue_name: str):
         """Declare a queue if it doesn't exist."""
+        if queue_name in self._declared_queues:
+            return
         self.client.declare_queue(queue_name)
+        self._declared_queues.add(queue_name)
 
     def send_message(self, service_type_enum, message: Dict[str, Any], video_id: str = None) -> bool:
         """
@@ -27,7 +32,7 @@ class QueueManager:
         queue_name = f"{service_type_enum.name}"
 
         try:
-            self.client.declare_queue(queue_name)
+            self.declare_queue(queue_name)
             self.client.publish_message(queue_name, message)
             if video_id:
                 self.logger.info("[%s] Published message to queue '%s'", video_id, queue_name)
@@ -41,6 +46,19 @@ class QueueManager:
                 self.logger.error("Failed to publish message to queue '%s': %s", queue_name, e)
             return False
 
+    def send_messages(self, service_type_enum, messages: List[Dict[str, Any]]) -> int:
+        """
+        Send many messages to a queue using the service type enum, in one batch.
+        Returns the number of messages sent, which are always the first ones in the list.
+        """
+        queue_name = f"{service_type_enum.name}"
+        try:
+            self.declare_queue(queue_name)
+        except Exception as e:
+            self.logger.error("Failed to declare queue '%s': %s", queue_name, e)
+            return 0
+        return self.client.publish_messages(queue_name, messages)
+
     async def send_message_async(self, service_type_enum, message: Dict[str, Any], video_id: str = None) -> bool:
         """
         Async version to send a message to a queue using service type enum.
@@ -1,6 +1,8 @@
 import time
+import random
 import logging
 from functools import wraps
+from src.constants.time_constants import BACKOFF_MULTIPLIER
 
 logger = logging.getLogger(__name__)
 
@@ -36,3 +38,13 @@ def resilient_consumer(max_retries=3, delay=5):
             # The final exception handling and DB update should be in the consumer itself.
         return wrapper
     return decorator
+
+
+def backoff_with_jitter(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Returns how long to wait before retry number attempt (starting at 0), growing exponentially
+    up to max_delay. The delay is randomized by +-50%, so replicas that failed together do not
+    all retry at the same moment.
+    """
+    delay = min(max_delay, base_delay * BACKOFF_MULTIPLIER ** attempt)
+    return delay * random.uniform(0.5, 1.5)
@@ -0,0 +1,70 @@
+"""
+Utility module for converting WebVTT caption files into plain transcription text.
+"""
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# Header, metadata and cue timing lines that carry no spoken text, matched in a single scan
+VTT_SKIP_LINE_PATTERN = re.compile(r"^(?:WEBVTT|Kind:|Language:|NOTE|STYLE)|-->")
+# Inline timestamp and styling tags, e.g. <00:00:01.500> or <c>...</c>
+VTT_INLINE_TAG_PATTERN = re.compile(r"<[^>\n]+>")
+
+
+class VttParser:
+    """
+    Converts WebVTT captions to plain text, so captioned videos can skip audio transcription.
+    """
+
+    @staticmethod
+    def _iter_spoken_lines(vtt_lines: Iterable[str]) -> Iterator[str]:
+        """
+        Yields the spoken text of each VTT line, one line at a time.
+
+        Timing lines, header lines and inline tags are dropped. Auto-generated captions
+        repeat each line across consecutive cues, so consecutive duplicate lines are yielded once.
+        """
+        previous_line = None
+        for line in vtt_lines:
+            if VTT_SKIP_LINE_PATTERN.search(line):
+                continue
+            line = VTT_INLINE_TAG_PATTERN.sub("", line).strip()
+            if line and line != previous_line:
+                yield line
+                previous_line = line
+
+    @staticmethod
+    def to_plain_text(vtt_path: Path) -> str:
+        """
+        Reads a VTT file and returns its spoken text. The file is read one line at a time, so only
+        the spoken text is held in memory, not the whole file as well.
+        """
+        with open(vtt_path, "r", encoding="utf-8") as vtt_file:
+            return " ".join(VttParser._iter_spoken_lines(vtt_file))
+
+    @staticmethod
+    def write_plain_text(vtt_path: Path, output_path: Path) -> int:
+        """
+        Streams the spoken text of a VTT file into output_path, one line at a time, so memory use
+        does not grow with the caption length. The text is written to a temporary '.part' file
+        that only replaces output_path once complete.
+
+        Returns:
+            int: The number of characters written.
+        """
+        output_path = Path(output_path)
+        partial_path = output_path.with_name(f"{output_path.name}.part")
+        characters_written = 0
+        try:
+            with open(vtt_path, "r", encoding="utf-8") as vtt_file, open(partial_path, "w", encoding="utf-8") as output_file:
+                for line in VttParser._iter_spoken_lines(vtt_file):
+                    if characters_written:
+                        line = f" {line}"
+                    output_file.write(line)
+                    characters_written += len(line)
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        return characters_written
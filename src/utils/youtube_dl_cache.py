@@ -0,0 +1,37 @@
+"""
+Utility module for reusing yt-dlp instances across calls.
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+from yt_dlp import YoutubeDL
+from src.constants.service_constants import YT_DLP_CACHE_DIR_ENV, DEFAULT_YT_DLP_CACHE_DIR_NAME
+
+
+def get_yt_dlp_cache_dir() -> str:
+    """
+    Gets the on-disk yt-dlp cache directory shared by all instances and processes, so the
+    YouTube player JS and signature decipher data are fetched once rather than per instance.
+    """
+    return os.getenv(YT_DLP_CACHE_DIR_ENV) or str(Path.home() / ".cache" / DEFAULT_YT_DLP_CACHE_DIR_NAME)
+
+
+class ThreadLocalYoutubeDL:
+    """
+    Keeps one YoutubeDL instance per thread for a fixed set of options.
+
+    Creating a YoutubeDL sets up its extractors and cookie jar, so instances are reused across calls.
+    YoutubeDL is not thread-safe, so each thread gets its own instance instead of sharing one behind a lock.
+    """
+    def __init__(self, ydl_opts: Dict):
+        self._ydl_opts = {'cachedir': get_yt_dlp_cache_dir(), **ydl_opts}
+        self._thread_local = threading.local()
+
+    def get(self) -> YoutubeDL:
+        """Returns the calling thread's YoutubeDL instance, creating it on first use."""
+        ydl = getattr(self._thread_local, "ydl", None)
+        if ydl is None:
+            ydl = YoutubeDL(self._ydl_opts)
+            self._thread_local.ydl = ydl
+        return ydl